@@ -31,6 +31,7 @@ class CurationConfig(BaseModel):
     max_size: tuple[int, int] = (512, 512)
     jpeg_quality: int = 60
     batch_size: int = 5
+    max_concurrent_batches: int = 4
     dry_run: bool = False
     force: bool = False  # Force re-curation even if already processed
 
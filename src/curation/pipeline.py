@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import List, Optional
+import os
 import shutil
 import asyncio
 import gc
@@ -58,9 +59,8 @@ class CurationPipeline:
                 pass
 
         image_files = self._find_images(folder)
-        
+
         # Step 1: Score all images in batches
-        all_scores = []
         paths_to_score = []
         skipped_results = []
         
@@ -81,67 +81,90 @@ class CurationPipeline:
             else:
                 paths_to_score.append(path)
         
-        # Score in batches to avoid overwhelming the API
-        for i in range(0, len(paths_to_score), self.config.batch_size):
-            if self.consecutive_errors >= self.max_consecutive_errors:
-                print("Circuit breaker triggered. Stopping curation.")
-                break
-                
-            batch_paths = paths_to_score[i : i + self.config.batch_size]
-            try:
-                batch_scores = await self.scorer.score_batch(batch_paths)
-                all_scores.extend(batch_scores)
+        # Score in batches; up to max_concurrent_batches requests are in
+        # flight at once so one slow response doesn't serialize the folder
+        batch_size = self.config.batch_size
+        batches = [
+            paths_to_score[i : i + batch_size]
+            for i in range(0, len(paths_to_score), batch_size)
+        ]
+        sem = asyncio.Semaphore(self.config.max_concurrent_batches)
+
+        async def score_one_batch(batch_paths: List[Path]):
+            async with sem:
+                # Check after waiting on the semaphore: batches ahead of us
+                # may have tripped the breaker in the meantime
+                if self.consecutive_errors >= self.max_consecutive_errors:
+                    return None
+                try:
+                    scores = await self.scorer.score_batch(batch_paths)
+                except Exception as e:
+                    self.consecutive_errors += 1
+                    return e
                 self.consecutive_errors = 0
-                
-                # Save scores to database (skip explicit photos)
-                if self.db:
-                    for path, score in zip(batch_paths, batch_scores):
-                        try:
-                            # Resolve model name from DB
-                            base_incoming = Path("data/incoming").resolve()
-                            relative = path.resolve().relative_to(base_incoming)
-                            db_key = str(relative.parent)
-                            model_name = self.db.get_model_by_path(db_key)
-                            
-                            # Convert ImageScore to dict
-                            score_dict = {
-                                'wow_factor': score.wow_factor,
-                                'engagement': score.engagement,
-                                'tiktok_fit': score.tiktok_fit,
-                                'is_explicit': score.is_explicit,
-                                'reasoning': score.reasoning,
-                                'watermark_offset_pct': score.watermark_offset_pct
-                            }
-                            
-                            # Use relative path as file_path identifier
-                            result = self.db.save_photo_score(str(relative), score_dict, model_name)
-                            if result is None and not score.is_explicit:
-                                print(f"DEBUG: Failed to save score for {relative} (not explicit, but returned None - duplicate?)")
-                            elif result is not None:
-                                print(f"DEBUG: Saved score for {relative} with id={result}")
-                            elif score.is_explicit:
-                                print(f"DEBUG: Skipped explicit photo {relative}")
-                        except Exception as e:
-                            # Don't fail the pipeline if DB save fails, but log it
-                            print(f"ERROR saving score to DB for {path}: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            
-            except Exception as e:
-                self.consecutive_errors += 1
+                return scores
+
+        outcomes = await asyncio.gather(*(score_one_batch(b) for b in batches))
+        if any(outcome is None for outcome in outcomes):
+            print("Circuit breaker triggered. Stopping curation.")
+
+        # Reassemble in original batch order so paths and scores stay
+        # paired regardless of which batch finished first
+        path_score_pairs = []
+        for batch_paths, outcome in zip(batches, outcomes):
+            if outcome is None:
+                # Skipped by the circuit breaker
+                continue
+            if isinstance(outcome, Exception):
                 # Add error results for failed batch
                 for path in batch_paths:
                     skipped_results.append(CurationResult(
                         source_path=path,
                         curated=False,
-                        error=str(e)
+                        error=str(outcome)
                     ))
-            
-            # Force garbage collection
-            gc.collect()
-        
+                continue
+
+            path_score_pairs.extend(zip(batch_paths, outcome))
+
+            # Save scores to database (skip explicit photos)
+            if self.db:
+                for path, score in zip(batch_paths, outcome):
+                    try:
+                        # Resolve model name from DB
+                        base_incoming = Path("data/incoming").resolve()
+                        relative = path.resolve().relative_to(base_incoming)
+                        db_key = str(relative.parent)
+                        model_name = self.db.get_model_by_path(db_key)
+
+                        # Convert ImageScore to dict
+                        score_dict = {
+                            'wow_factor': score.wow_factor,
+                            'engagement': score.engagement,
+                            'tiktok_fit': score.tiktok_fit,
+                            'is_explicit': score.is_explicit,
+                            'reasoning': score.reasoning,
+                            'watermark_offset_pct': score.watermark_offset_pct
+                        }
+
+                        # Use relative path as file_path identifier
+                        result = self.db.save_photo_score(str(relative), score_dict, model_name)
+                        if result is None and not score.is_explicit:
+                            print(f"DEBUG: Failed to save score for {relative} (not explicit, but returned None - duplicate?)")
+                        elif result is not None:
+                            print(f"DEBUG: Saved score for {relative} with id={result}")
+                        elif score.is_explicit:
+                            print(f"DEBUG: Skipped explicit photo {relative}")
+                    except Exception as e:
+                        # Don't fail the pipeline if DB save fails, but log it
+                        print(f"ERROR saving score to DB for {path}: {e}")
+                        import traceback
+                        traceback.print_exc()
+
+        # Force garbage collection after the scoring burst
+        gc.collect()
+
         # Step 2: Apply selection logic to ALL scored images (folder-level)
-        path_score_pairs = list(zip(paths_to_score[:len(all_scores)], all_scores))
         
         # Separate explicit and non-explicit
         non_explicit = [(p, s) for p, s in path_score_pairs if not s.is_explicit]
@@ -463,12 +486,25 @@ class CurationPipeline:
         return dest
 
     def _find_images(self, folder: Path) -> List[Path]:
-        """Recursively find image files."""
-        extensions = {".jpg", ".jpeg", ".png", ".webp"}
-        files = [
-            f for f in folder.rglob("*") 
-            if f.suffix.lower() in extensions and f.is_file()
-        ]
+        """Recursively find image files.
+
+        Walks with os.scandir so the file-type check comes from the
+        directory entry itself; rglob stats every path a second time.
+        """
+        extensions = (".jpg", ".jpeg", ".png", ".webp")
+        files = []
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        elif entry.name.lower().endswith(extensions) and entry.is_file():
+                            files.append(Path(entry.path))
+            except OSError:
+                continue
         return sorted(files)
 
     def _create_report(
@@ -479,23 +515,30 @@ class CurationPipeline:
     ) -> CurationReport:
         """Generate summary report."""
         total = len(results)
-        curated = sum(1 for r in results if r.curated)
-        errors = sum(1 for r in results if r.error)
-        
+        curated = 0
+        errors = 0
         explicit = 0
         low_score = 0
         total_score = 0.0
         scored_count = 0
-        
+        threshold = self.config.threshold
+
+        # Single pass over the results; combined_score is a computed
+        # property, so read it once per result
         for r in results:
+            if r.curated:
+                curated += 1
+            if r.error:
+                errors += 1
             if r.score:
                 scored_count += 1
-                total_score += r.score.combined_score
+                combined = r.score.combined_score
+                total_score += combined
                 if r.score.is_explicit:
                     explicit += 1
-                elif r.score.combined_score < self.config.threshold:
+                elif combined < threshold:
                     low_score += 1
-                    
+
         avg_score = total_score / scored_count if scored_count > 0 else 0.0
         
         return CurationReport(
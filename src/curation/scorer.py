@@ -2,40 +2,189 @@ from pathlib import Path
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage
 from langchain_core.output_parsers import JsonOutputParser
+from functools import lru_cache
 from typing import List, Union
 import asyncio
+import hashlib
+import httpx
+import orjson
 import os
+import random
+import sqlite3
+import time
 
 from src.curation.models import ImageScore
 from src.curation.thumbnail import ThumbnailGenerator
 from src.curation.prompts import SCORING_PROMPT_SYSTEM, BatchImageScores
 
+# Bump when SCORING_PROMPT_SYSTEM changes meaning; invalidates cached responses
+PROMPT_VERSION = "1"
+
+# Transient network/provider failures worth retrying; JSON parse errors
+# are deterministic and must not be retried
+RETRYABLE_EXCEPTIONS = (
+    TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    httpx.HTTPStatusError,
+)
+
+@lru_cache(maxsize=1)
+def _default_thumbnail_generator() -> ThumbnailGenerator:
+    """Shared stateless ThumbnailGenerator for scorers using defaults."""
+    return ThumbnailGenerator()
+
+
+@lru_cache(maxsize=None)
+def _json_parser(pydantic_object) -> JsonOutputParser:
+    """One JsonOutputParser per schema; building the parser walks the
+    pydantic model's JSON schema, which is wasted work per scorer."""
+    return JsonOutputParser(pydantic_object=pydantic_object)
+
+
+class TokenBucket:
+    """Two-bucket rate limiter: requests/min and tokens/min.
+
+    Both buckets refill continuously with elapsed time; acquire() sleeps
+    until the request fits, shaping throughput proactively instead of
+    eating 429s and tripping the pipeline's circuit breaker.
+    """
+
+    def __init__(self, rpm_limit: int, tpm_limit: int):
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self._requests = float(rpm_limit)
+        self._tokens = float(tpm_limit)
+        self._last = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        self._requests = min(self.rpm_limit, self._requests + elapsed * self.rpm_limit / 60.0)
+        self._tokens = min(self.tpm_limit, self._tokens + elapsed * self.tpm_limit / 60.0)
+
+    async def acquire(self, estimated_tokens: int):
+        while True:
+            self._refill()
+            if self._requests >= 1 and self._tokens >= estimated_tokens:
+                self._requests -= 1
+                self._tokens -= estimated_tokens
+                return
+            # Wait for whichever bucket is short
+            need_requests = max(0.0, (1 - self._requests) * 60.0 / self.rpm_limit)
+            need_tokens = max(0.0, (estimated_tokens - self._tokens) * 60.0 / self.tpm_limit)
+            await asyncio.sleep(max(need_requests, need_tokens, 0.01))
+
+class ResponseCache:
+    """SQLite-backed cache of LLM scoring responses.
+
+    Keyed by SHA256 of (thumbnail base64, model, prompt version), so
+    curation reruns after a threshold change cost zero API calls for
+    images already scored.
+    """
+
+    def __init__(self, db_path: Path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key BLOB PRIMARY KEY,
+                response_json TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+
+    def get(self, key: bytes) -> str | None:
+        row = self.conn.execute(
+            "SELECT response_json FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: bytes, response_json: str):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, response_json, time.time())
+            )
+
 class ImageScorer:
     """Scores images using Groq Vision API."""
-    
+
     def __init__(
-        self, 
+        self,
         model: str = "meta-llama/llama-4-maverick-17b-128e-instruct",
-        api_key: str | None = None
+        api_key: str | None = None,
+        cache_path: Path | None = None,
+        rpm_limit: int | None = None,
+        tpm_limit: int | None = None
     ):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("GROQ_API_KEY is not set")
-            
+
+        self.model = model
         self.llm = ChatGroq(
-            model=model, 
+            model=model,
             temperature=0,
             api_key=self.api_key,
             max_retries=3
         )
-        self.thumbnail_gen = ThumbnailGenerator()
-        self.parser = JsonOutputParser(pydantic_object=ImageScore)
-        self.batch_parser = JsonOutputParser(pydantic_object=BatchImageScores)
+        self.thumbnail_gen = _default_thumbnail_generator()
+        self.parser = _json_parser(ImageScore)
+        self.batch_parser = _json_parser(BatchImageScores)
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        self.bucket = (
+            TokenBucket(rpm_limit, tpm_limit)
+            if rpm_limit and tpm_limit else None
+        )
+
+    def _cache_key(self, base64_image: str) -> bytes:
+        return hashlib.sha256(
+            (base64_image + self.model + PROMPT_VERSION).encode()
+        ).digest()
+
+    async def _ainvoke_with_retry(
+        self, messages, attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0
+    ):
+        """Invoke the LLM with full-jitter exponential backoff on transient errors.
+
+        delay = random(0, min(base * 2^n, max_delay)), so retries from
+        concurrent pipelines don't synchronize. Non-retryable errors
+        propagate immediately.
+        """
+        for attempt in range(attempts):
+            try:
+                return await self.llm.ainvoke(messages)
+            except RETRYABLE_EXCEPTIONS:
+                if attempt == attempts - 1:
+                    raise
+                delay = random.uniform(0, min(base_delay * 2 ** attempt, max_delay))
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _parse_json(content, parser):
+        """Parse LLM output, trying orjson before the langchain parser.
+
+        Well-behaved responses are plain JSON, which orjson parses ~3x
+        faster; markdown-fenced or otherwise messy output falls back to
+        the JsonOutputParser's tolerant extraction.
+        """
+        if isinstance(content, (str, bytes)):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+        return parser.parse(content)
 
     async def score(self, image_path: Path) -> ImageScore:
         """Score a single image."""
         base64_image = self.thumbnail_gen.to_base64(image_path)
-        
+
+        if self.cache:
+            cached = self.cache.get(self._cache_key(base64_image))
+            if cached is not None:
+                return ImageScore.model_validate_json(cached)
+
         message = HumanMessage(
             content=[
                 {"type": "text", "text": SCORING_PROMPT_SYSTEM},
@@ -45,59 +194,91 @@ class ImageScorer:
                 }
             ]
         )
-        
+
+        if self.bucket:
+            await self.bucket.acquire(self.thumbnail_gen.estimate_tokens(image_path))
+
         try:
-            response = await self.llm.ainvoke([message])
+            response = await self._ainvoke_with_retry([message])
             # Parse response -> returns dict
-            data = self.parser.parse(response.content)
-            return ImageScore(**data)
+            data = self._parse_json(response.content, self.parser)
+            result = ImageScore(**data)
         except Exception as e:
             raise RuntimeError(f"Scoring failed for {image_path.name}: {e}")
 
+        if self.cache:
+            self.cache.put(self._cache_key(base64_image), result.model_dump_json())
+        return result
+
     async def score_batch(self, image_paths: List[Path]) -> List[ImageScore]:
         """Score multiple images in one request."""
         if not image_paths:
             return []
-            
+
+        # PIL decodes/encodes in C and releases the GIL, so thumbnail
+        # prep for the whole batch runs in worker threads concurrently
+        base64_imgs = await asyncio.gather(
+            *[asyncio.to_thread(self.thumbnail_gen.to_base64, path) for path in image_paths]
+        )
+
+        # Serve cached responses and only send cache misses to the LLM
+        results: list[ImageScore | None] = [None] * len(image_paths)
+        misses = list(range(len(image_paths)))
+        if self.cache:
+            misses = []
+            for i, base64_img in enumerate(base64_imgs):
+                cached = self.cache.get(self._cache_key(base64_img))
+                if cached is not None:
+                    results[i] = ImageScore.model_validate_json(cached)
+                else:
+                    misses.append(i)
+            if not misses:
+                return results
+
         # Prepare content blocks
         content = [{"type": "text", "text": SCORING_PROMPT_SYSTEM}]
-        
-        for path in image_paths:
-            base64_img = self.thumbnail_gen.to_base64(path)
+
+        for i in misses:
             content.append({
                 "type": "image_url",
-                "image_url": {"url": f"data:image/jpeg;base64,{base64_img}"}
+                "image_url": {"url": f"data:image/jpeg;base64,{base64_imgs[i]}"}
             })
-            
+
         message = HumanMessage(content=content)
-        
+
+        if self.bucket:
+            estimated = sum(
+                self.thumbnail_gen.estimate_tokens(image_paths[i]) for i in misses
+            )
+            await self.bucket.acquire(estimated)
+
         try:
-            response = await self.llm.ainvoke([message])
-            parsed = self.batch_parser.parse(response.content)
-            
+            response = await self._ainvoke_with_retry([message])
+            parsed = self._parse_json(response.content, self.batch_parser)
+
             # Ensure we got expected number of scores
-            if len(parsed['scores']) != len(image_paths):
-                # Fallback or strict error? 
+            if len(parsed['scores']) != len(misses):
+                # Fallback or strict error?
                 # Strict error is safer to detect misalignment
-                raise ValueError(f"Batch mismatch: sent {len(image_paths)}, got {len(parsed['scores'])}")
-                
+                raise ValueError(f"Batch mismatch: sent {len(misses)}, got {len(parsed['scores'])}")
+
             # Convert dicts back to ImageScore objects if parser returned dicts
-            results = []
-            for item in parsed['scores']:
-                if isinstance(item, ImageScore):
-                    results.append(item)
-                else:
-                    results.append(ImageScore(**item))
+            for i, item in zip(misses, parsed['scores']):
+                score = item if isinstance(item, ImageScore) else ImageScore(**item)
+                results[i] = score
+                if self.cache:
+                    self.cache.put(self._cache_key(base64_imgs[i]), score.model_dump_json())
             return results
-            
+
         except Exception as e:
-            # Fallback to sequential scoring if batch fails
+            # Fallback to per-image scoring if batch fails
             # This handles cases where the LLM produces invalid JSON for the batch
             # or misses fields for specific items in the list.
-            print(f"Batch scoring failed ({e}), falling back to sequential...")
-            results = []
-            for path in image_paths:
-                # If a single image fails in sequential mode, it will raise and stop the process.
-                # This preserves the original behavior of ensuring all images are scored or failing.
-                results.append(await self.score(path))
+            print(f"Batch scoring failed ({e}), falling back to per-image scoring...")
+            # Per-image requests are independent network calls, so issue
+            # them concurrently; if any single image fails it still raises
+            # and stops the process, preserving all-or-nothing semantics.
+            scored = await asyncio.gather(*[self.score(image_paths[i]) for i in misses])
+            for i, score in zip(misses, scored):
+                results[i] = score
             return results
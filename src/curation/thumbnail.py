@@ -2,6 +2,44 @@ from pathlib import Path
 from PIL import Image
 import base64
 import io
+import mmap
+
+# JPEG start-of-frame markers that carry image dimensions (baseline,
+# progressive and the other sequential variants); C4/C8/CC are not SOFs
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_dimensions(buf) -> tuple[int, int] | None:
+    """Read (width, height) from a JPEG's SOF header without decoding.
+
+    Walks the marker segments of the mmap'd file; returns None for
+    anything that doesn't parse cleanly as a JPEG.
+    """
+    size = len(buf)
+    if size < 4 or buf[0] != 0xFF or buf[1] != 0xD8:
+        return None
+    pos = 2
+    while pos + 4 <= size:
+        if buf[pos] != 0xFF:
+            return None
+        # Skip fill bytes
+        while pos + 1 < size and buf[pos + 1] == 0xFF:
+            pos += 1
+        marker = buf[pos + 1]
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > size:
+                return None
+            height = (buf[pos + 5] << 8) | buf[pos + 6]
+            width = (buf[pos + 7] << 8) | buf[pos + 8]
+            return width, height
+        if marker == 0xD9:  # EOI before any SOF
+            return None
+        length = (buf[pos + 2] << 8) | buf[pos + 3]
+        if length < 2:
+            return None
+        pos += 2 + length
+    return None
+
 
 class ThumbnailGenerator:
     """Optimizes images for LLM consumption (resize, compress, encode)."""
@@ -23,9 +61,32 @@ class ThumbnailGenerator:
         - Compresses to specified quality
         - Returns bytes
         """
+        return self._encode_to_buffer(image_path).getvalue()
+
+    def _encode_to_buffer(self, image_path: Path) -> io.BytesIO:
+        """Resize and JPEG-encode into a BytesIO without copying out."""
+        # JPEG sources already within max_size skip libjpeg entirely:
+        # sniff the dimensions from the SOF header via mmap and pass the
+        # original bytes through untouched
+        if self.format == "JPEG" and image_path.suffix.lower() in (".jpg", ".jpeg"):
+            try:
+                with open(image_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    dims = _jpeg_dimensions(mm)
+                    if dims and dims[0] <= self.max_size[0] and dims[1] <= self.max_size[1]:
+                        return io.BytesIO(mm[:])
+            except (OSError, ValueError):
+                # Unreadable or empty file; let the PIL path report it
+                pass
+
         img_copy = None
         try:
             with Image.open(image_path) as img:
+                # JPEG fast path: ask the decoder to downscale in the DCT
+                # domain during decode (no-op for other formats), so large
+                # sources never materialize at full resolution
+                img.draft("RGB", self.max_size)
+
                 # Convert to RGB if needed (handles RGBA, P, etc. for JPEG)
                 if img.mode in ("RGBA", "P"):
                     img = img.convert("RGB")
@@ -46,7 +107,7 @@ class ThumbnailGenerator:
                 quality=self.quality, 
                 optimize=True
             )
-            return buffer.getvalue()
+            return buffer
         except OSError as e:
             # Re-raise with context if file issues
             raise OSError(f"Failed to process image {image_path}: {e}")
@@ -59,8 +120,10 @@ class ThumbnailGenerator:
 
     def to_base64(self, image_path: Path) -> str:
         """Returns base64-encoded string for API usage."""
-        thumbnail_bytes = self.generate(image_path)
-        return base64.b64encode(thumbnail_bytes).decode("utf-8")
+        # Encode straight from the buffer's memoryview; getvalue() would
+        # copy the whole JPEG first
+        buffer = self._encode_to_buffer(image_path)
+        return base64.b64encode(buffer.getbuffer()).decode("utf-8")
     
     def estimate_tokens(self, image_path: Path) -> int:
         """
@@ -5,6 +5,7 @@ Generates TikTok-ready videos with synchronized TTS audio and karaoke-style subt
 
 from .models import (
     WordBoundary,
+    WordBoundaries,
     SubtitleEvent,
     TTSResult,
     KaraokeResult,
@@ -14,6 +15,7 @@ from .pipeline import KaraokePipeline
 
 __all__ = [
     "WordBoundary",
+    "WordBoundaries",
     "SubtitleEvent",
     "TTSResult",
     "KaraokeResult",
@@ -1,6 +1,7 @@
 """ASS subtitle file generation with karaoke effects."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
@@ -8,6 +9,53 @@ from PIL import ImageFont
 
 from .models import SubtitleEvent, SubtitleStyle
 
+# Zero-padded two-digit strings, indexed by value; minutes, seconds and
+# centiseconds are all < 100 so formatting is three list lookups
+_PAD2 = [f"{i:02d}" for i in range(100)]
+
+
+@lru_cache(maxsize=4096)
+def text_width(font: ImageFont.FreeTypeFont, text: str) -> float:
+    """Measure text width in pixels, cached per (font, text).
+
+    Module scope so other modules that need font metrics share the cache.
+    The same words and prefixes are measured repeatedly while generating
+    box-highlight lines.
+    """
+    return float(font.getlength(text))
+
+
+@lru_cache(maxsize=1024)
+def _rounded_rect_path(width: float, height: float, r: float) -> str:
+    """Build ASS drawing path for a rounded rectangle centered at (0,0).
+
+    Cached because long scripts repeat the same (width, height, radius)
+    combinations for every occurrence of a word.
+    """
+    w = width / 2
+    h = height / 2
+
+    # Start at top edge
+    # m x y (move)
+    # l x y (line)
+    # b x1 y1 x2 y2 x3 y3 (cubic bezier)
+
+    # Simplification: if radius is too large, cap it
+    r = min(r, w, h)
+
+    path = [
+        f"m {-w+r} {-h}",                   # Top left start
+        f"l {w-r} {-h}",                    # Top edge
+        f"b {w} {-h} {w} {-h} {w} {-h+r}",  # Top right corner
+        f"l {w} {h-r}",                     # Right edge
+        f"b {w} {h} {w} {h} {w-r} {h}",     # Bottom right corner
+        f"l {-w+r} {h}",                    # Bottom edge
+        f"b {-w} {h} {-w} {h} {-w} {h-r}",  # Bottom left corner
+        f"l {-w} {-h+r}",                   # Left edge
+        f"b {-w} {-h} {-w} {-h} {-w+r} {-h}" # Top left corner back
+    ]
+    return " ".join(path)
+
 
 class ASSGenerator:
     """Generates ASS subtitle files with karaoke tags."""
@@ -40,8 +88,8 @@ class ASSGenerator:
         """Calculate text width in pixels."""
         if not text:
             return 0.0
-        # Use getlength for precise width calculation
-        return float(self._font.getlength(text))
+        # Use getlength for precise width calculation (cached)
+        return text_width(self._font, text)
 
     def generate(
         self,
@@ -63,29 +111,36 @@ class ASSGenerator:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            # Write header
-            f.write(self._generate_header(video_width, video_height))
-
-            # Write events
-            f.write("\n[Events]\n")
-            f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-
-            for event in events:
-                if self.style.use_box_highlight:
-                    # Layer 0: Static, pale background text
-                    f.write(self._generate_layer0_line(event) + "\n")
-                    
-                    # Layer 1 & 2: Word-by-word highlights
-                    for i in range(len(event.words)):
-                        # Layer 1: Pink rounded box drawing
-                        f.write(self._generate_layer1_box_line(event, i, video_width, video_height) + "\n")
-                        # Layer 2: White text with black outline
-                        f.write(self._generate_layer2_word_line(event, i, video_width, video_height) + "\n")
-                else:
-                    # Classic karaoke style
-                    dialogue_line = self._generate_dialogue(event)
-                    f.write(dialogue_line + "\n")
+        # Accumulate lines and join/write once; per-line f.write() costs a
+        # buffered-IO call per dialogue line, and box-highlight scripts
+        # emit 1 + 2N lines per event
+        parts = [self._generate_header(video_width, video_height)]
+        parts.append("[Events]")
+        parts.append("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text")
+
+        for event in events:
+            if self.style.use_box_highlight:
+                # Join (and uppercase) the line once per event; the
+                # layer helpers otherwise recompute it 1 + 2N times.
+                full_text = " ".join(event.word_texts)
+                if self.style.use_uppercase:
+                    full_text = full_text.upper()
+
+                # Layer 0: Static, pale background text
+                parts.append(self._generate_layer0_line(event, full_text))
+
+                # Layer 1 & 2: Word-by-word highlights
+                for i in range(len(event.words)):
+                    # Layer 1: Pink rounded box drawing
+                    parts.append(self._generate_layer1_box_line(event, i, video_width, video_height, full_text))
+                    # Layer 2: White text with black outline
+                    parts.append(self._generate_layer2_word_line(event, i, video_width, video_height, full_text))
+            else:
+                # Classic karaoke style
+                parts.append(self._generate_dialogue(event))
+
+        parts.append("")  # Trailing newline
+        output_path.write_text("\n".join(parts), encoding="utf-8")
 
         return output_path
 
@@ -109,41 +164,33 @@ Style: Highlight,{self.style.font_name},{self.style.font_size},{self.style.prima
 """
         return header
 
-    def _generate_layer0_line(self, event: SubtitleEvent) -> str:
+    def _generate_layer0_line(self, event: SubtitleEvent, full_text: str) -> str:
         """Generate background text line (Layer 0)."""
         start = self._format_timestamp(event.start_time_ms)
         end = self._format_timestamp(event.end_time_ms)
-        
+
         # Plain text without tags for the background layer
-        text = " ".join([w.text for w in event.words])
-        if self.style.use_uppercase:
-            text = text.upper()
-        return f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}"
+        return f"Dialogue: 0,{start},{end},Default,,0,0,0,,{full_text}"
 
     def _generate_layer1_box_line(
-        self, event: SubtitleEvent, active_index: int, video_width: int, video_height: int
+        self, event: SubtitleEvent, active_index: int, video_width: int, video_height: int, full_text: str
     ) -> str:
         """Generate a pink rounded box drawing (Layer 1)."""
-        word = event.words[active_index]
-        start = self._format_timestamp(word.audio_offset_ms)
-        end = self._format_timestamp(word.audio_offset_ms + word.duration_ms)
-        
+        start = self._format_timestamp(event.word_starts_ms[active_index])
+        end = self._format_timestamp(event.word_ends_ms[active_index])
+
         # Calculate box coordinates relative to line center
-        full_text = " ".join([w.text for w in event.words])
-        if self.style.use_uppercase:
-            full_text = full_text.upper()
-            
         full_width = self._get_text_width(full_text)
-        
+
         # Get start position of the active word
-        prefix_words = [w.text for w in event.words[:active_index]]
+        prefix_words = event.word_texts[:active_index]
         prefix_text = " ".join(prefix_words)
         if prefix_words:
             prefix_text += " "
         if self.style.use_uppercase:
             prefix_text = prefix_text.upper()
-        
-        word_text = event.words[active_index].text
+
+        word_text = event.word_texts[active_index]
         if self.style.use_uppercase:
             word_text = word_text.upper()
             
@@ -178,70 +225,51 @@ Style: Highlight,{self.style.font_name},{self.style.font_size},{self.style.prima
         return f"Dialogue: 1,{start},{end},Highlight,,0,0,0,,{{{pos_tag}{color_tag}{blur_tag}\\p1}}{drawing}{{\\p0}}"
 
     def _generate_layer2_word_line(
-        self, event: SubtitleEvent, active_index: int, video_width: int, video_height: int
+        self, event: SubtitleEvent, active_index: int, video_width: int, video_height: int, full_text: str
     ) -> str:
         """Generate a single word text line (Layer 2) with outline."""
-        word = event.words[active_index]
-        start = self._format_timestamp(word.audio_offset_ms)
-        end = self._format_timestamp(word.audio_offset_ms + word.duration_ms)
-        
+        start = self._format_timestamp(event.word_starts_ms[active_index])
+        end = self._format_timestamp(event.word_ends_ms[active_index])
+
         # For the text line, we ALSO use \pos to ensure it's exactly aligned with the box
         # and doesn't shift due to leading/trailing space transparency
-        full_text = " ".join([w.text for w in event.words])
-        if self.style.use_uppercase:
-            full_text = full_text.upper()
         full_width = self._get_text_width(full_text)
-        
+
+        # Position just the active word absolutely, same strategy as the
+        # Layer 1 box. This replaces emitting the whole line with
+        # alpha-transparent padding words, which cost O(line length) per
+        # word line.
+        prefix_words = event.word_texts[:active_index]
+        prefix_text = " ".join(prefix_words)
+        if prefix_words:
+            prefix_text += " "
+        word_text = event.word_texts[active_index]
+        if self.style.use_uppercase:
+            prefix_text = prefix_text.upper()
+            word_text = word_text.upper()
+
+        x_start = self._get_text_width(prefix_text)
+        word_width = self._get_text_width(word_text)
+
+        # Offset relative to center (same math as the box layer)
+        relative_x = x_start - (full_width / 2) + (word_width / 2)
+
         base_x = video_width / 2
         base_y = video_height - self.style.margin_v
-        
-        # We place the WHOLE line at the base position, but only the active word is visible
-        pos_tag = f"\\an2\\pos({base_x:.1f},{base_y:.1f})"
-        
-        parts = []
-        for i, w in enumerate(event.words):
-            word_text = w.text.upper() if self.style.use_uppercase else w.text
-            if i == active_index:
-                # Active word: white text with black outline
-                parts.append(word_text)
-            else:
-                # Inactive word: completely transparent
-                parts.append(f"{{\\alpha&HFF&}}{word_text}{{\\alpha&H00&}}")
-            
-            if i < len(event.words) - 1:
-                parts.append(f"{{\\alpha&HFF&}} {{\\alpha&H00&}}")
-                
-        text = "".join(parts)
-        return f"Dialogue: 2,{start},{end},Highlight,,0,0,0,,{{{pos_tag}}}{text}"
+
+        abs_x = base_x + relative_x
+        # Center on the box (see _generate_layer1_box_line)
+        abs_y = base_y - (self.style.font_size * 0.45)
+
+        pos_tag = f"\\an5\\pos({abs_x:.1f},{abs_y:.1f})"
+        return f"Dialogue: 2,{start},{end},Highlight,,0,0,0,,{{{pos_tag}}}{word_text}"
 
     def _generate_rounded_rect_path(self, width: float, height: float, r: float) -> str:
         """Generate ASS drawing path for a rounded rectangle.
-        
+
         Centered at (0,0).
         """
-        w = width / 2
-        h = height / 2
-        
-        # Start at top edge
-        # m x y (move)
-        # l x y (line)
-        # b x1 y1 x2 y2 x3 y3 (cubic bezier)
-        
-        # Simplification: if radius is too large, cap it
-        r = min(r, w, h)
-        
-        path = [
-            f"m {-w+r} {-h}",                   # Top left start
-            f"l {w-r} {-h}",                    # Top edge
-            f"b {w} {-h} {w} {-h} {w} {-h+r}",  # Top right corner
-            f"l {w} {h-r}",                     # Right edge
-            f"b {w} {h} {w} {h} {w-r} {h}",     # Bottom right corner
-            f"l {-w+r} {h}",                    # Bottom edge
-            f"b {-w} {h} {-w} {h} {-w} {h-r}",  # Bottom left corner
-            f"l {-w} {-h+r}",                   # Left edge
-            f"b {-w} {-h} {-w} {-h} {-w+r} {-h}" # Top left corner back
-        ]
-        return " ".join(path)
+        return _rounded_rect_path(width, height, r)
 
     def _generate_dialogue(self, event: SubtitleEvent) -> str:
         """Generate classic karaoke dialogue line."""
@@ -250,15 +278,20 @@ Style: Highlight,{self.style.font_name},{self.style.font_size},{self.style.prima
         karaoke_text = self._generate_karaoke_tags(event)
         return f"Dialogue: 0,{start},{end},Default,,0,0,0,,{karaoke_text}"
 
-    def _format_timestamp(self, ms: int) -> str:
-        """Format milliseconds to ASS timestamp format."""
-        hours = ms // 3600000
-        ms %= 3600000
-        minutes = ms // 60000
-        ms %= 60000
-        seconds = ms // 1000
-        centiseconds = (ms % 1000) // 10
-        return f"{hours}:{minutes:02d}:{seconds:02d}.{centiseconds:02d}"
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _format_timestamp(ms: int) -> str:
+        """Format milliseconds to ASS timestamp format.
+
+        Memoized: word n's end timestamp is word n+1's start, and layer 1
+        and 2 lines share the same word times, so repeats dominate. Cache
+        misses format the two-digit fields via the _PAD2 lookup table
+        instead of f-string padding.
+        """
+        total_s, cs = divmod(ms // 10, 100)
+        total_m, seconds = divmod(total_s, 60)
+        hours, minutes = divmod(total_m, 60)
+        return f"{hours}:{_PAD2[minutes]}:{_PAD2[seconds]}.{_PAD2[cs]}"
 
     def _generate_karaoke_tags(self, event: SubtitleEvent) -> str:
         """Generate classic karaoke tags."""
@@ -14,6 +14,55 @@ class WordBoundary:
     duration_ms: int  # Duration in milliseconds
 
 
+@dataclass
+class WordBoundaries:
+    """Struct-of-arrays container for word timing data.
+
+    Holds three parallel lists instead of one WordBoundary object per
+    word, so bulk operations (interpolation, serialization) index flat
+    lists. Iteration and indexing materialize WordBoundary views, so the
+    container can stand in for List[WordBoundary] downstream.
+    """
+
+    texts: List[str] = field(default_factory=list)
+    offsets_ms: List[int] = field(default_factory=list)
+    durations_ms: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_words(cls, words: List[WordBoundary]) -> "WordBoundaries":
+        return cls(
+            texts=[w.text for w in words],
+            offsets_ms=[w.audio_offset_ms for w in words],
+            durations_ms=[w.duration_ms for w in words],
+        )
+
+    def append(self, text: str, audio_offset_ms: int, duration_ms: int) -> None:
+        self.texts.append(text)
+        self.offsets_ms.append(audio_offset_ms)
+        self.durations_ms.append(duration_ms)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                WordBoundary(t, o, d)
+                for t, o, d in zip(
+                    self.texts[index],
+                    self.offsets_ms[index],
+                    self.durations_ms[index],
+                )
+            ]
+        return WordBoundary(
+            self.texts[index], self.offsets_ms[index], self.durations_ms[index]
+        )
+
+    def __iter__(self):
+        for t, o, d in zip(self.texts, self.offsets_ms, self.durations_ms):
+            yield WordBoundary(t, o, d)
+
+
 @dataclass
 class SubtitleEvent:
     """Represents a single subtitle line with multiple words."""
@@ -21,6 +70,19 @@ class SubtitleEvent:
     start_time_ms: int
     end_time_ms: int
     words: List[WordBoundary]
+    # Structure-of-arrays mirror of `words`, populated on construction.
+    # Rendering code indexes these flat lists instead of re-walking
+    # WordBoundary objects for every generated line.
+    word_texts: List[str] = field(init=False, repr=False)
+    word_starts_ms: List[int] = field(init=False, repr=False)
+    word_ends_ms: List[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.word_texts = [w.text for w in self.words]
+        self.word_starts_ms = [w.audio_offset_ms for w in self.words]
+        self.word_ends_ms = [
+            w.audio_offset_ms + w.duration_ms for w in self.words
+        ]
 
 
 @dataclass
@@ -28,7 +90,7 @@ class TTSResult:
     """Result from TTS synthesis."""
 
     audio_path: Path
-    word_boundaries: List[WordBoundary]
+    word_boundaries: "WordBoundaries | List[WordBoundary]"
     total_duration_ms: int
 
 
@@ -100,6 +162,19 @@ class RendererConfig:
     audio_codec: str = "aac"
     crf: int = 23  # Quality (lower = better)
     preset: str = "medium"
+    threads: int = 0  # ffmpeg encoder threads (0 = all cores)
+    max_workers: Optional[int] = None  # Parallel renders in render_batch
+
+
+@dataclass
+class RenderJob:
+    """A single render request for KaraokeRenderer.render_batch."""
+
+    background_video: Path
+    audio: Path
+    subtitles: Path
+    output: Path
+    target_duration_ms: int
 
 
 @dataclass
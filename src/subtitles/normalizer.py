@@ -16,6 +16,17 @@ class TokenType(str, Enum):
     WHITESPACE = "whitespace"
 
 
+# Compiled once; named groups classify tokens directly from m.lastgroup
+# instead of re-matching each token text
+_TOKEN_RE = re.compile(r"(?P<WORD>\w+)|(?P<WHITESPACE>\s+)|(?P<PUNCTUATION>[^\w\s])")
+
+_TOKEN_TYPES = {
+    "WORD": TokenType.WORD,
+    "WHITESPACE": TokenType.WHITESPACE,
+    "PUNCTUATION": TokenType.PUNCTUATION,
+}
+
+
 class Token:
     """Represents a single token from text."""
 
@@ -44,6 +55,23 @@ class TextNormalizer:
         """
         self.config = config or NormalizationConfig()
 
+        # Build one translation table up front so quote/dash replacement
+        # is a single C-level pass instead of one scan per variant
+        table: dict[int, int] = {}
+        if self.config.normalize_quotes:
+            # Convert fancy quotes to standard
+            table[0x201C] = 0x22  # Left double quote
+            table[0x201D] = 0x22  # Right double quote
+            table[0x2018] = 0x27  # Left single quote
+            table[0x2019] = 0x27  # Right single quote
+            table[0x00AB] = 0x22  # Left guillemet
+            table[0x00BB] = 0x22  # Right guillemet
+        if self.config.normalize_dashes:
+            # Convert em/en dashes to hyphen
+            table[0x2014] = 0x2D  # Em dash
+            table[0x2013] = 0x2D  # En dash
+        self._trans = table or None
+
     def normalize(self, text: str) -> str:
         """Normalize text for TTS synthesis.
 
@@ -61,17 +89,9 @@ class TextNormalizer:
                 ch for ch in result if unicodedata.category(ch)[0] != "C" or ch in "\n\t"
             )
 
-        # Normalize quotes
-        if self.config.normalize_quotes:
-            # Convert fancy quotes to standard
-            result = result.replace("\u201c", '"').replace("\u201d", '"')  # Left/right double quotes
-            result = result.replace("\u2018", "'").replace("\u2019", "'")  # Left/right single quotes
-            result = result.replace("\u00ab", '"').replace("\u00bb", '"')  # Guillemets
-
-        # Normalize dashes
-        if self.config.normalize_dashes:
-            # Convert em/en dashes to hyphen
-            result = result.replace("—", "-").replace("–", "-")
+        # Normalize quotes and dashes in one translate pass
+        if self._trans:
+            result = result.translate(self._trans)
 
         # Collapse whitespace
         if self.config.collapse_whitespace:
@@ -89,29 +109,10 @@ class TextNormalizer:
         Returns:
             List of tokens
         """
-        tokens = []
-
-        # Pattern to split into words, punctuation, and whitespace
-        pattern = r"(\w+|[^\w\s]|\s+)"
-        matches = re.finditer(pattern, text)
-
-        for match in matches:
-            token_text = match.group(0)
-
-            if not token_text:
-                continue
-
-            # Determine token type
-            if token_text.isspace():
-                token_type = TokenType.WHITESPACE
-            elif re.match(r"\w+", token_text):
-                token_type = TokenType.WORD
-            else:
-                token_type = TokenType.PUNCTUATION
-
-            tokens.append(Token(token_text, token_type))
-
-        return tokens
+        return [
+            Token(match.group(), _TOKEN_TYPES[match.lastgroup])
+            for match in _TOKEN_RE.finditer(text)
+        ]
 
     def get_word_tokens(self, text: str) -> List[str]:
         """Extract only word tokens from text.
@@ -122,5 +123,8 @@ class TextNormalizer:
         Returns:
             List of word strings
         """
-        tokens = self.tokenize(text)
-        return [token.text for token in tokens if token.type == TokenType.WORD]
+        return [
+            match.group()
+            for match in _TOKEN_RE.finditer(text)
+            if match.lastgroup == "WORD"
+        ]
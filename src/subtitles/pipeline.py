@@ -73,11 +73,10 @@ class KaraokePipeline:
             if audio_path.exists():
                 logger.info("Using cached TTS audio")
                 # Load cached word boundaries
-                import json
+                import orjson
 
                 boundaries_path = artifact_dir / "word_boundaries.json"
-                with open(boundaries_path, "r", encoding="utf-8") as f:
-                    boundaries_data = json.load(f)
+                boundaries_data = orjson.loads(boundaries_path.read_bytes())
 
                 from .models import WordBoundary
 
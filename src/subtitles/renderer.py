@@ -1,14 +1,56 @@
 """Video rendering with subtitle burning."""
 
-import json
 import logging
+import os
 import subprocess
+
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from multiprocessing import get_context
 from pathlib import Path
+from typing import List
 
-from .models import RendererConfig
+from .models import RendererConfig, RenderJob
 
 logger = logging.getLogger(__name__)
 
+_nvenc_available: bool | None = None
+
+# ffprobe results keyed by (path, mtime_ns, size); bulk renders reuse
+# the same handful of background clips.
+_PROBE_CACHE: dict = {}
+
+
+def _detect_nvenc() -> bool:
+    """Check once whether ffmpeg exposes the h264_nvenc encoder."""
+    global _nvenc_available
+    if _nvenc_available is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            _nvenc_available = "h264_nvenc" in result.stdout
+        except OSError:
+            _nvenc_available = False
+        if _nvenc_available:
+            logger.info("h264_nvenc encoder detected, using GPU encoding")
+    return _nvenc_available
+
+
+def _render_job(config: RendererConfig, job: RenderJob) -> Path:
+    """Worker entry point for render_batch (must be picklable)."""
+    return KaraokeRenderer(config).render_video(
+        background_video=job.background_video,
+        audio=job.audio,
+        subtitles=job.subtitles,
+        output=job.output,
+        target_duration_ms=job.target_duration_ms,
+    )
+
 
 class KaraokeRenderer:
     """Renders final video with audio and burned-in subtitles."""
@@ -41,36 +83,40 @@ class KaraokeRenderer:
         Returns:
             Path to rendered video
         """
-        # Probe background video
-        video_info = self._probe_video(background_video)
-        video_duration_ms = int(float(video_info["duration"]) * 1000)
-        width = int(video_info["width"])
-        height = int(video_info["height"])
-
-        logger.info(
-            f"Background video: {width}x{height}, duration: {video_duration_ms}ms"
-        )
         logger.info(f"Target duration: {target_duration_ms}ms")
 
         # Prepare FFmpeg command
         output.parent.mkdir(parents=True, exist_ok=True)
 
-        # Build video filter
-        vf_parts = []
-
-        # Crop to 9:16 if needed
-        target_aspect = self.config.target_height / self.config.target_width  # 16/9
-        current_aspect = height / width
-
-        if abs(current_aspect - target_aspect) > 0.01:  # Not already 9:16
-            # Center crop to 9:16
-            crop_width = int(height / target_aspect)
-            crop_x = (width - crop_width) // 2
-            vf_parts.append(f"crop={crop_width}:{height}:{crop_x}:0")
-            logger.info(f"Cropping to 9:16: {crop_width}x{height}")
+        # Build video filter. Scale/crop use ffmpeg's own expression
+        # evaluator, so we don't need to probe the input dimensions:
+        # scale so both dims cover the target, then center-crop to it.
+        w = self.config.target_width
+        h = self.config.target_height
+
+        # Fast path: when the background already matches the target
+        # frame, the only video work left is the subtitle burn-in. The
+        # probe is cached per file, so bulk renders pay for it once.
+        needs_resize = True
+        try:
+            video_info = self._probe_video(background_video)
+            needs_resize = (
+                int(video_info["width"]),
+                int(video_info["height"]),
+            ) != (w, h)
+        except Exception:
+            pass
 
-        # Scale to target resolution
-        vf_parts.append(f"scale={self.config.target_width}:{self.config.target_height}")
+        vf_parts = []
+        if needs_resize:
+            vf_parts.extend(
+                [
+                    f"scale={w}:{h}:force_original_aspect_ratio=increase",
+                    f"crop={w}:{h}",
+                ]
+            )
+        else:
+            logger.info("Background matches target resolution, skipping scale/crop")
 
         # Burn subtitles using filename parameter
         # Use absolute path with forward slashes (Unix style)
@@ -79,15 +125,17 @@ class KaraokeRenderer:
 
         vf = ",".join(vf_parts)
 
-        # Determine if we need to loop or trim
         target_duration_sec = target_duration_ms / 1000
 
-        cmd = ["ffmpeg", "-y"]
+        # -hwaccel auto offloads background decode to the GPU when one
+        # is available and silently falls back to software otherwise;
+        # it must precede the input it applies to.
+        cmd = ["ffmpeg", "-y", "-hwaccel", "auto"]
 
-        # Loop video if it's shorter than audio
-        if video_duration_ms < target_duration_ms:
-            cmd.extend(["-stream_loop", "-1"])
-            logger.info("Looping video to match audio duration")
+        # Loop unconditionally: a background longer than the audio is
+        # simply trimmed by -t, and a shorter one wraps around. This is
+        # what previously required probing the input duration.
+        cmd.extend(["-stream_loop", "-1"])
 
         cmd.extend(
             [
@@ -97,14 +145,18 @@ class KaraokeRenderer:
                 str(audio),
                 "-vf",
                 vf,
-                "-c:v",
-                self.config.video_codec,
-                "-preset",
-                self.config.preset,
-                "-crf",
-                str(self.config.crf),
-                "-c:a",
-                self.config.audio_codec,
+            ]
+        )
+        cmd.extend(self._codec_args())
+
+        # Audio already in the target codec can be stream-copied
+        if audio.suffix.lower() in (".aac", ".m4a") and self.config.audio_codec == "aac":
+            cmd.extend(["-c:a", "copy"])
+        else:
+            cmd.extend(["-c:a", self.config.audio_codec])
+
+        cmd.extend(
+            [
                 "-shortest",
                 "-t",
                 str(target_duration_sec),
@@ -126,6 +178,68 @@ class KaraokeRenderer:
         logger.info(f"Video rendered successfully: {output}")
         return output
 
+    def _codec_args(self) -> List[str]:
+        """Build video codec arguments, preferring NVENC when present.
+
+        The GPU path only kicks in for the default libx264 codec; an
+        explicitly configured codec is always respected. CRF maps onto
+        NVENC's CQ rate control.
+        """
+        if self.config.video_codec == "libx264" and _detect_nvenc():
+            return [
+                "-c:v",
+                "h264_nvenc",
+                "-preset",
+                "p4",
+                "-tune",
+                "hq",
+                "-rc",
+                "vbr",
+                "-cq",
+                str(self.config.crf),
+            ]
+        return [
+            "-c:v",
+            self.config.video_codec,
+            "-threads",
+            str(self.config.threads),
+            "-preset",
+            self.config.preset,
+            "-crf",
+            str(self.config.crf),
+        ]
+
+    def render_batch(self, jobs: List[RenderJob]) -> List[Path]:
+        """Render multiple videos in parallel across CPU cores.
+
+        Each job runs its own ffmpeg; worker count is bounded so the
+        encoders don't oversubscribe the machine, and per-job ffmpeg
+        threads are divided accordingly.
+
+        Args:
+            jobs: Render jobs to execute
+
+        Returns:
+            Output paths, in job order
+        """
+        if not jobs:
+            return []
+
+        cpu_count = os.cpu_count() or 1
+        max_workers = self.config.max_workers or max(1, min(len(jobs), cpu_count))
+        threads_per_job = max(1, cpu_count // max_workers)
+        job_config = replace(self.config, threads=threads_per_job)
+
+        logger.info(
+            f"Rendering {len(jobs)} videos with {max_workers} workers "
+            f"({threads_per_job} ffmpeg threads each)"
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=get_context("spawn")
+        ) as pool:
+            return list(pool.map(_render_job, [job_config] * len(jobs), jobs))
+
     def _probe_video(self, video_path: Path) -> dict:
         """Probe video file for metadata.
 
@@ -135,6 +249,12 @@ class KaraokeRenderer:
         Returns:
             Dictionary with video metadata
         """
+        st = video_path.stat()
+        key = (str(video_path), st.st_mtime_ns, st.st_size)
+        cached = _PROBE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         cmd = [
             "ffprobe",
             "-v",
@@ -147,16 +267,24 @@ class KaraokeRenderer:
             str(video_path),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)
+        # Read ffprobe's JSON straight off the pipe as bytes; no text
+        # decode or intermediate CompletedProcess buffers
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ) as proc:
+            data = orjson.loads(proc.stdout.read())
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
 
         if not data.get("streams"):
             raise ValueError(f"No video stream found in {video_path}")
 
         stream = data["streams"][0]
 
-        return {
+        info = {
             "width": stream.get("width"),
             "height": stream.get("height"),
             "duration": stream.get("duration") or data.get("format", {}).get("duration"),
         }
+        _PROBE_CACHE[key] = info
+        return info
@@ -31,47 +31,52 @@ class SubtitleSegmenter:
         if not word_boundaries:
             return []
 
+        max_chars = self.config.max_chars_per_line
+        max_words = self.config.max_words_per_segment
+        min_words = self.config.min_words_per_segment
+
+        # Precompute per-word lengths and sentence-end flags up front so
+        # the scan below is pure integer/flag work.
+        lengths = [len(w.text) for w in word_boundaries]
+        sentence_end = [self._is_sentence_end(w.text) for w in word_boundaries]
+        last = len(word_boundaries) - 1
+
         events = []
-        current_words = []
+        seg_start = 0
         current_char_count = 0
 
-        for i, word in enumerate(word_boundaries):
-            word_length = len(word.text)
+        for i in range(len(word_boundaries)):
+            word_length = lengths[i]
+            seg_len = i - seg_start  # words buffered so far
 
             # Check if adding this word would exceed limits
             would_exceed_chars = (
-                current_char_count + word_length + len(current_words)  # spaces
-                > self.config.max_chars_per_line
+                current_char_count + word_length + seg_len  # spaces
+                > max_chars
             )
-            would_exceed_words = len(current_words) >= self.config.max_words_per_segment
+            would_exceed_words = seg_len >= max_words
 
             # Should we break here?
             should_break = False
 
             if would_exceed_chars or would_exceed_words:
                 should_break = True
-            elif len(current_words) >= self.config.min_words_per_segment:
+            elif seg_len >= min_words:
                 # Check if this is a good breaking point (punctuation)
-                if i < len(word_boundaries) - 1:  # Not last word
-                    next_word = word_boundaries[i + 1].text
-                    if self._is_sentence_end(word.text):
-                        should_break = True
-
-            # Create event if we should break and have words
-            if should_break and current_words:
-                event = self._create_event(current_words)
-                events.append(event)
-                current_words = []
+                if i < last and sentence_end[i]:
+                    should_break = True
+
+            # Create event if we should break and have buffered words;
+            # the slice is materialized only once per emitted event
+            if should_break and seg_len > 0:
+                events.append(self._create_event(word_boundaries[seg_start:i]))
+                seg_start = i
                 current_char_count = 0
 
-            # Add current word to buffer
-            current_words.append(word)
             current_char_count += word_length
 
         # Add remaining words as final event
-        if current_words:
-            event = self._create_event(current_words)
-            events.append(event)
+        events.append(self._create_event(word_boundaries[seg_start:]))
 
         logger.info(f"Segmented {len(word_boundaries)} words into {len(events)} events")
         return events
@@ -1,10 +1,20 @@
 """Storage manager for TTS artifacts."""
 
 import hashlib
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
+
+@lru_cache(maxsize=256)
+def _content_hash(normalized: str) -> str:
+    """Hash normalized text, memoized so repeated lookups for the same
+    script (artifact dir, cache checks) digest it only once."""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=6).hexdigest()
+
 
 class StorageManager:
     """Manages artifact storage with content-based hashing."""
@@ -18,17 +28,15 @@ class StorageManager:
         self.base_dir = base_dir
 
     def get_content_hash(self, text: str) -> str:
-        """Generate SHA-256 hash of normalized text.
+        """Generate BLAKE2b hash of normalized text.
 
         Args:
             text: Input text to hash
 
         Returns:
-            First 12 characters of SHA-256 hash
+            12-character hex digest
         """
-        normalized = text.strip().lower()
-        hash_obj = hashlib.sha256(normalized.encode("utf-8"))
-        return hash_obj.hexdigest()[:12]
+        return _content_hash(text.strip().lower())
 
     def get_artifact_dir(self, text: str) -> Path:
         """Get or create directory for text artifacts.
@@ -59,8 +67,11 @@ class StorageManager:
         """
         metadata = {"config": config, "stats": stats}
 
+        # Write to a sibling temp file and rename so a crash mid-write
+        # never leaves a truncated metadata.json behind
         metadata_path = artifact_dir / "metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        tmp_path = metadata_path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, metadata_path)
 
         return metadata_path
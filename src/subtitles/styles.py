@@ -1,13 +1,18 @@
 """Default subtitle styles and style loading."""
 
-import json
 from pathlib import Path
 
+import orjson
+
 from .models import SubtitleStyle
 
+# Parsed styles keyed by path; style files are static configuration, so
+# repeated loads (one per pipeline run) reuse the first parse.
+_style_cache: dict = {}
+
 
 def load_style_from_json(path: Path) -> SubtitleStyle:
-    """Load subtitle style from JSON file.
+    """Load subtitle style from JSON file (memoized per path).
 
     Args:
         path: Path to JSON style configuration
@@ -19,13 +24,18 @@ def load_style_from_json(path: Path) -> SubtitleStyle:
         FileNotFoundError: If file doesn't exist
         ValueError: If JSON is invalid
     """
+    cached = _style_cache.get(path)
+    if cached is not None:
+        return cached
+
     if not path.exists():
         raise FileNotFoundError(f"Style configuration not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
-    return SubtitleStyle(**data)
+    style = SubtitleStyle(**data)
+    _style_cache[path] = style
+    return style
 
 
 # Default styles
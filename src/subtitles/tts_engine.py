@@ -1,17 +1,21 @@
 """TTS engine using Edge TTS with word-boundary capture."""
 
 import asyncio
-import json
 import logging
 from pathlib import Path
 from typing import List
 
 import edge_tts
+import orjson
 
-from .models import TTSResult, WordBoundary
+from .models import TTSResult, WordBoundaries
 
 logger = logging.getLogger(__name__)
 
+# ffprobe durations keyed by (path, mtime_ns, size), mirroring the
+# renderer's probe cache; cached artifacts are re-probed on every run.
+_DURATION_CACHE: dict = {}
+
 
 class TTSEngine:
     """TTS engine for speech synthesis with word-boundary timing."""
@@ -52,26 +56,23 @@ class TTSEngine:
         # Create communicate object
         communicate = edge_tts.Communicate(text, self.voice, rate=self.rate, volume=self.volume)
 
-        # Synthesize and capture events
-        audio_data = b""
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_data += chunk["data"]
-            elif chunk["type"] == "WordBoundary":
-                self._word_boundaries.append(chunk)
-
-        # Write audio to file
+        # Synthesize and capture events, writing audio chunks straight
+        # to disk instead of accumulating the whole file in memory
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "wb") as f:
-            f.write(audio_data)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    self._word_boundaries.append(chunk)
 
-        # Convert word boundaries to WordBoundary objects
+        # Convert word boundary events to the SoA container
         word_boundaries = self._parse_word_boundaries()
 
         # Calculate total duration
         if word_boundaries:
             total_duration_ms = (
-                word_boundaries[-1].audio_offset_ms + word_boundaries[-1].duration_ms
+                word_boundaries.offsets_ms[-1] + word_boundaries.durations_ms[-1]
             )
         else:
             # Fallback: Edge TTS no longer returns WordBoundary events
@@ -82,19 +83,22 @@ class TTSEngine:
 
         # Save word boundaries to JSON
         boundaries_path = output_path.parent / "word_boundaries.json"
-        with open(boundaries_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [
-                    {
-                        "text": wb.text,
-                        "audio_offset_ms": wb.audio_offset_ms,
-                        "duration_ms": wb.duration_ms,
-                    }
-                    for wb in word_boundaries
-                ],
-                f,
-                indent=2,
-                ensure_ascii=False,
+        with open(boundaries_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    [
+                        {
+                            "text": text,
+                            "audio_offset_ms": offset_ms,
+                            "duration_ms": duration_ms,
+                        }
+                        for text, offset_ms, duration_ms in zip(
+                            word_boundaries.texts,
+                            word_boundaries.offsets_ms,
+                            word_boundaries.durations_ms,
+                        )
+                    ]
+                )
             )
 
         return TTSResult(
@@ -103,13 +107,22 @@ class TTSEngine:
             total_duration_ms=total_duration_ms,
         )
 
-    def _parse_word_boundaries(self) -> List[WordBoundary]:
+    def _parse_word_boundaries(self) -> WordBoundaries:
         """Parse word boundary events from Edge TTS.
 
+        Parsing and timing interpolation are fused into one pass: while
+        converting events we accumulate the sum/count of valid durations
+        and remember which words are missing timing, then backfill those
+        with the mean.
+
         Returns:
-            List of WordBoundary objects
+            WordBoundaries container with interpolated timings
         """
-        boundaries = []
+        boundaries = WordBoundaries()
+        durations = boundaries.durations_ms
+        missing_indices = []
+        valid_sum = 0
+        valid_count = 0
 
         for event in self._word_boundaries:
             # Edge TTS provides offset and duration in 100-nanosecond units
@@ -123,66 +136,34 @@ class TTSEngine:
             text = event.get("text", "")
 
             if text:  # Only include non-empty words
-                boundaries.append(
-                    WordBoundary(
-                        text=text,
-                        audio_offset_ms=offset_ms,
-                        duration_ms=duration_ms,
-                    )
-                )
-
-        # Interpolate missing durations if needed
-        boundaries = self._interpolate_missing_timings(boundaries)
-
-        return boundaries
-
-    def _interpolate_missing_timings(
-        self, boundaries: List[WordBoundary]
-    ) -> List[WordBoundary]:
-        """Interpolate timing data for words with missing durations.
-
-        Args:
-            boundaries: List of word boundaries
-
-        Returns:
-            List of word boundaries with interpolated timings
-        """
-        if not boundaries:
+                if duration_ms > 0:
+                    valid_sum += duration_ms
+                    valid_count += 1
+                else:
+                    missing_indices.append(len(durations))
+                boundaries.append(text, offset_ms, duration_ms)
+
+        if not missing_indices:
             return boundaries
 
-        # Count words with missing timings
-        missing_count = sum(1 for wb in boundaries if wb.duration_ms == 0)
-
-        if missing_count == 0:
-            return boundaries
-
-        # Calculate average duration from available data
-        valid_durations = [wb.duration_ms for wb in boundaries if wb.duration_ms > 0]
-
-        if not valid_durations:
+        if valid_count == 0:
             # No valid timings, use default
             avg_duration = 300  # 300ms default
             logger.warning(
                 f"No valid word timings found, using default {avg_duration}ms"
             )
         else:
-            avg_duration = sum(valid_durations) // len(valid_durations)
-
-        # Interpolate missing durations
-        for i, wb in enumerate(boundaries):
-            if wb.duration_ms == 0:
-                # Use average duration
-                boundaries[i] = WordBoundary(
-                    text=wb.text,
-                    audio_offset_ms=wb.audio_offset_ms,
-                    duration_ms=avg_duration,
-                )
+            avg_duration = valid_sum // valid_count
+
+        # Backfill missing durations with the mean
+        for i in missing_indices:
+            durations[i] = avg_duration
 
+        missing_count = len(missing_indices)
         interpolated_pct = (missing_count / len(boundaries)) * 100
-        if interpolated_pct > 0:
-            logger.warning(
-                f"Interpolated {missing_count}/{len(boundaries)} words ({interpolated_pct:.1f}%)"
-            )
+        logger.warning(
+            f"Interpolated {missing_count}/{len(boundaries)} words ({interpolated_pct:.1f}%)"
+        )
 
         return boundaries
 
@@ -197,21 +178,33 @@ class TTSEngine:
         """
         import subprocess
 
-        cmd = [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_format",
-            str(audio_path),
-        ]
-
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            st = audio_path.stat()
+            key = (str(audio_path), st.st_mtime_ns, st.st_size)
+            cached = _DURATION_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+            cmd = [
+                "ffprobe",
+                "-v",
+                "quiet",
+                "-print_format",
+                "json",
+                "-show_format",
+                str(audio_path),
+            ]
+
+            with subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            ) as proc:
+                data = orjson.loads(proc.stdout.read())
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
             duration_sec = float(data["format"]["duration"])
-            return int(duration_sec * 1000)
+            duration_ms = int(duration_sec * 1000)
+            _DURATION_CACHE[key] = duration_ms
+            return duration_ms
         except Exception as e:
             logger.error(f"Failed to get audio duration: {e}")
             # Fallback to conservative estimate
@@ -219,7 +212,7 @@ class TTSEngine:
 
     def _generate_synthetic_boundaries(
         self, text: str, total_duration_ms: int
-    ) -> List[WordBoundary]:
+    ) -> WordBoundaries:
         """Generate synthetic word boundaries by evenly distributing words across duration.
 
         Args:
@@ -227,7 +220,7 @@ class TTSEngine:
             total_duration_ms: Total audio duration in milliseconds
 
         Returns:
-            List of synthetic word boundaries
+            WordBoundaries container with synthetic timings
         """
         # Import normalizer to get words
         from .normalizer import TextNormalizer
@@ -237,23 +230,17 @@ class TTSEngine:
 
         if not words:
             logger.warning("No words found in text")
-            return []
+            return WordBoundaries()
 
-        # Distribute duration evenly across words
+        # Distribute duration evenly across words; offsets are just
+        # multiples of the per-word duration, no running accumulator needed
         word_duration_ms = total_duration_ms // len(words)
 
-        boundaries = []
-        current_offset = 0
-
-        for word in words:
-            boundaries.append(
-                WordBoundary(
-                    text=word,
-                    audio_offset_ms=current_offset,
-                    duration_ms=word_duration_ms,
-                )
-            )
-            current_offset += word_duration_ms
+        boundaries = WordBoundaries(
+            texts=list(words),
+            offsets_ms=[i * word_duration_ms for i in range(len(words))],
+            durations_ms=[word_duration_ms] * len(words),
+        )
 
         logger.info(
             f"Generated {len(boundaries)} synthetic word boundaries "
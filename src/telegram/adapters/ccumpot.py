@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from telethon.tl.types import Message
 from ..models import NormalizedMetadata, ContentFormat
 from .base import BaseAdapter
@@ -28,34 +29,53 @@ class CCumpotAdapter(BaseAdapter):
     
     def extract_metadata(self, message: Message) -> NormalizedMetadata:
         text = message.text or message.message or ""
-        model_name = self._parse_model_name(text)
-        set_name = self._parse_set_name(text)
+        stripped = self._parse_lines(text)
+        model_name = stripped[1] if len(stripped) > 1 and stripped[1] else "Unknown"
+        set_name = stripped[2] if len(stripped) > 2 and stripped[2] else None
         content_format = self._detect_format(message)
         return NormalizedMetadata(
             model_name=model_name,
             set_name=set_name,
             content_format=content_format
         )
+
+    @lru_cache(maxsize=256)
+    def _parse_lines(self, text: str) -> tuple:
+        """Strip and emoji-clean the first three caption lines.
+
+        Memoized per text so model/set parsing share one split + strip
+        per message instead of redoing both independently.
+        """
+        lines = text.strip().split('\n', 3)[:3]
+        # Rejoin and strip emoji in one regex pass over all lines
+        # instead of one scan per line; the split lines contain no
+        # newlines, so the delimiter round-trips safely.
+        joined = '\n'.join(lines)
+        if not joined.isascii():
+            joined = EMOJI_PATTERN.sub('', joined)
+        return tuple(line.strip() for line in joined.split('\n'))
     
     def _strip_emoji(self, text: str) -> str:
         """Removes all emojis from a string."""
+        # Every range in EMOJI_PATTERN is non-ASCII, so pure-ASCII text
+        # can skip the regex scan entirely.
+        if text.isascii():
+            return text.strip()
         return EMOJI_PATTERN.sub('', text).strip()
     
     def _parse_model_name(self, text: str) -> str:
         """Extracts model name from the second line, stripping emojis."""
-        lines = text.strip().split('\n')
-        if len(lines) < 2:
-            return "Unknown"
-        second_line = self._strip_emoji(lines[1])
-        return second_line if second_line else "Unknown"
-    
+        stripped = self._parse_lines(text)
+        if len(stripped) > 1 and stripped[1]:
+            return stripped[1]
+        return "Unknown"
+
     def _parse_set_name(self, text: str) -> str | None:
         """Extracts set name from the third line, stripping emojis."""
-        lines = text.strip().split('\n')
-        if len(lines) < 3:
-            return None
-        third_line = self._strip_emoji(lines[2])
-        return third_line if third_line else None
+        stripped = self._parse_lines(text)
+        if len(stripped) > 2 and stripped[2]:
+            return stripped[2]
+        return None
         
     def _detect_format(self, message: Message) -> ContentFormat:
         if not message.media:
@@ -12,6 +12,30 @@ from .adapters.base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
+class _RateLimiter:
+    """Minimal async rate limiter: at most `rate` acquisitions per second.
+
+    Proactive pacing keeps sustained throughput just under Telegram's
+    ~30 ops/sec ceiling instead of reacting to FloodWait after the fact.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, *exc):
+        return False
+
 class TelegramClientWrapper:
     def __init__(self, session_path: Path, db: TelegramImportDB):
         self.session_path = session_path
@@ -24,6 +48,13 @@ class TelegramClientWrapper:
         # The design shows `__init__(self, session_path: Path, api_id: int, api_hash: str)`
         # I will update the init to match the design.
         self.client = None
+        self._dl_sem = None
+        self._api_limiter = None
+        # channel_name -> resolved entity; repeated imports of the same
+        # channel skip the ResolveUsername round-trip
+        self._entity_cache = {}
+        # Folders already created this session; skips repeat mkdir syscalls
+        self._mkdir_cache: set[Path] = set()
 
     async def connect(self, api_id: int, api_hash: str):
         """Connect to Telegram."""
@@ -31,6 +62,11 @@ class TelegramClientWrapper:
         await self.client.connect()
         if not await self.client.is_user_authorized():
             raise RuntimeError("Session is not authorized. Please log in manually first.")
+        # Bounded concurrency for media downloads; keeps the pipe busy
+        # without triggering FloodWait
+        self._dl_sem = asyncio.Semaphore(4)
+        # Pace API-heavy operations safely below Telegram's ~30 ops/sec cap
+        self._api_limiter = _RateLimiter(25)
 
     async def import_channel(
         self, 
@@ -43,155 +79,267 @@ class TelegramClientWrapper:
         if not self.client:
             raise RuntimeError("Client not connected")
 
-        result = ImportResult(
-            total_processed=0,
-            downloaded=0,
-            skipped_duplicates=0,
-            errors=0
-        )
-        
+        from .settings import MAX_CONSECUTIVE_ERRORS, STOP_AFTER_DUPLICATES
+
+        # Track counters in plain locals inside the hot loop and build
+        # the ImportResult once at the end
+        total_processed = 0
+        downloaded = 0
+        skipped_duplicates = 0
+        errors = 0
+        stopped_early = False
+
         consecutive_errors = 0
-        MAX_CONSECUTIVE_ERRORS = 3
-        
-        try:
-            entity = await self.client.get_entity(channel_name)
-        except ValueError:
-            logger.error(f"Channel {channel_name} not found")
-            result.errors += 1
-            return result
-        except Exception as e:
-            logger.error(f"Error getting entity {channel_name}: {e}")
-            result.errors += 1
-            return result
-
-        # Iterate posts from newest to oldest
-        # We iterate without a limit, but stop when we've downloaded enough new posts
-        async for message in self.client.iter_messages(entity):
-            result.total_processed += 1
-            
-            # 1. Filter
-            if not adapter.filter(message):
-                continue
-                
-            # 2. Check duplicates - but don't stop, just skip and continue
-            is_duplicate = self.db.post_exists(channel_name, message.id)
-            if is_duplicate:
-                result.skipped_duplicates += 1
-                logger.info(f"Skipping duplicate post {message.id}")
-                # Continue to next post instead of counting towards limit
-                continue
-            else:
-                logger.info(f"Processing new post {message.id}")
-            
-            # 3. Process & Download
+        consecutive_duplicates = 0
+
+        entity = self._entity_cache.get(channel_name)
+        if entity is None:
             try:
-                metadata = adapter.extract_metadata(message)
-                
-                # Format timestamp folder name
-                timestamp_str = message.date.strftime("%Y-%m-%d_%H-%M-%S")
-                save_dir = incoming_dir / channel_name / timestamp_str
-                save_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Download media from post and comments
-                downloaded_paths = await self.download_media_with_comments(message, save_dir, entity)
-                
-                if not downloaded_paths:
-                    logger.warning(f"No media downloaded for post {message.id}")
-                    # Treat as non-fatal, maybe just filter said so?
-                
-                # We save relative path to the folder, as there might be multiple files
-                relative_path = f"{channel_name}/{timestamp_str}"
-                
-                post_record = ImportedPost(
-                    channel_name=channel_name,
-                    post_id=message.id,
-                    date=message.date,
-                    model_name=metadata.model_name,
-                    set_name=metadata.set_name,
-                    content_format=metadata.content_format,
-                    file_path=relative_path
+                async with self._api_limiter:
+                    entity = await self.client.get_entity(channel_name)
+                self._entity_cache[channel_name] = entity
+            except ValueError:
+                logger.error(f"Channel {channel_name} not found")
+                return ImportResult(
+                    total_processed=0, downloaded=0, skipped_duplicates=0, errors=1
+                )
+            except ChannelPrivateError:
+                logger.error(f"Channel {channel_name} is private")
+                self._entity_cache.pop(channel_name, None)
+                return ImportResult(
+                    total_processed=0, downloaded=0, skipped_duplicates=0, errors=1
                 )
-                
-                self.db.save_post(post_record)
-                result.downloaded += 1
-                consecutive_errors = 0 # Reset on success
-                
-                # Check if we've reached the limit of NEW posts downloaded
-                if limit is not None and result.downloaded >= limit:
-                    logger.info(f"Reached limit of {limit} downloaded posts")
-                    break
-                
             except Exception as e:
-                logger.error(f"Error processing post {message.id}: {e}")
-                result.errors += 1
-                consecutive_errors += 1
-                if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
-                    logger.error("Too many consecutive errors. Stopping import.")
-                    result.stopped_early = True
-                    break
-        
-        return result
+                logger.error(f"Error getting entity {channel_name}: {e}")
+                return ImportResult(
+                    total_processed=0, downloaded=0, skipped_duplicates=0, errors=1
+                )
+
+        # Preload the channel's imported post_ids once so the per-message
+        # duplicate check is a set lookup instead of a SQLite query
+        known_ids = self.db.get_known_post_ids(channel_name)
+
+        # Buffer new post records and flush them in batches so SQLite
+        # commits once per batch instead of once per post
+        pending: list[ImportedPost] = []
+        FLUSH_EVERY = 16
 
-    async def download_media_with_comments(self, message: Message, dest_folder: Path, channel_entity) -> list[Path]:
-        """Downloads all media from the message and its comments into the specified folder."""
-        from .settings import MAX_FILE_SIZE_BYTES
-        
-        paths = []
-        
-        # Download main post media
         try:
-            # Check file size before downloading
-            if message.media and hasattr(message.media, 'document'):
-                file_size = getattr(message.media.document, 'size', 0)
-                if file_size > MAX_FILE_SIZE_BYTES:
-                    logger.warning(f"Skipping main post media: file size {file_size / 1024 / 1024:.2f}MB exceeds limit")
+            # Iterate posts from newest to oldest
+            # We iterate without a limit, but stop when we've downloaded enough new posts
+            async for message in self.client.iter_messages(entity):
+                total_processed += 1
+
+                # 1. Filter
+                if not adapter.filter(message):
+                    continue
+
+                # 2. Check duplicates - but don't stop, just skip and continue
+                is_duplicate = message.id in known_ids
+                if is_duplicate:
+                    skipped_duplicates += 1
+                    consecutive_duplicates += 1
+                    logger.info(f"Skipping duplicate post {message.id}")
+                    if consecutive_duplicates >= STOP_AFTER_DUPLICATES:
+                        logger.info(
+                            f"Hit {consecutive_duplicates} consecutive duplicates, "
+                            "assuming we've caught up with history. Stopping."
+                        )
+                        break
+                    # Continue to next post instead of counting towards limit
+                    continue
                 else:
-                    path = await self.client.download_media(message, file=dest_folder)
-                    if path:
-                        paths.append(Path(path))
-                        logger.info(f"Downloaded main post media: {path}")
-            elif message.media:
-                # Photo doesn't have size attribute, download directly
-                path = await self.client.download_media(message, file=dest_folder)
-                if path:
-                    paths.append(Path(path))
-                    logger.info(f"Downloaded main post media: {path}")
-        except Exception as e:
-            logger.error(f"Download failed for main post: {e}")
-            raise e
-        
-        # Download media from comments
+                    consecutive_duplicates = 0
+                    logger.info(f"Processing new post {message.id}")
+
+                # 3. Process & Download
+                try:
+                    metadata = adapter.extract_metadata(message)
+
+                    # Format timestamp folder name; the fixed ASCII layout
+                    # doesn't need strftime's locale machinery
+                    d = message.date
+                    timestamp_str = (
+                        f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+                        f"_{d.hour:02d}-{d.minute:02d}-{d.second:02d}"
+                    )
+                    save_dir = incoming_dir / channel_name / timestamp_str
+                    if save_dir not in self._mkdir_cache:
+                        save_dir.mkdir(parents=True, exist_ok=True)
+                        self._mkdir_cache.add(save_dir)
+
+                    # Download media from post and comments
+                    downloaded_paths = await self.download_media_with_comments(message, save_dir, entity)
+
+                    if not downloaded_paths:
+                        logger.warning(f"No media downloaded for post {message.id}")
+                        # Treat as non-fatal, maybe just filter said so?
+
+                    # We save relative path to the folder, as there might be multiple files
+                    relative_path = f"{channel_name}/{timestamp_str}"
+
+                    post_record = ImportedPost(
+                        channel_name=channel_name,
+                        post_id=message.id,
+                        date=message.date,
+                        model_name=metadata.model_name,
+                        set_name=metadata.set_name,
+                        content_format=metadata.content_format,
+                        file_path=relative_path
+                    )
+
+                    pending.append(post_record)
+                    known_ids.add(message.id)
+                    downloaded += 1
+                    consecutive_errors = 0 # Reset on success
+
+                    if len(pending) >= FLUSH_EVERY:
+                        self.db.save_posts_bulk(pending)
+                        pending.clear()
+
+                    # Check if we've reached the limit of NEW posts downloaded
+                    if limit is not None and downloaded >= limit:
+                        logger.info(f"Reached limit of {limit} downloaded posts")
+                        break
+
+                except Exception as e:
+                    logger.error(f"Error processing post {message.id}: {e}")
+                    if isinstance(e, ChannelPrivateError):
+                        # Cached entity is stale once access is revoked
+                        self._entity_cache.pop(channel_name, None)
+                    errors += 1
+                    consecutive_errors += 1
+                    if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                        logger.error("Too many consecutive errors. Stopping import.")
+                        stopped_early = True
+                        break
+        finally:
+            # Flush whatever is left, whichever way the loop exited
+            self.db.save_posts_bulk(pending)
+
+        return ImportResult(
+            total_processed=total_processed,
+            downloaded=downloaded,
+            skipped_duplicates=skipped_duplicates,
+            errors=errors,
+            stopped_early=stopped_early,
+        )
+
+    def _media_within_size_limit(self, msg: Message, label: str) -> bool:
+        """Check media size against MAX_FILE_SIZE_BYTES before downloading.
+
+        Uses Telethon's message.file.size, which is populated for photos
+        as well as documents, so oversized photos are caught too.
+        """
+        from .settings import MAX_FILE_SIZE_BYTES
+
+        size = getattr(msg.file, 'size', None) if msg.file else None
+        if size and size > MAX_FILE_SIZE_BYTES:
+            logger.warning(f"Skipping {label} media: file size {size / 1024 / 1024:.2f}MB exceeds limit")
+            return False
+        return True
+
+    async def _download_one(self, message: Message, dest_folder: Path) -> Path | None:
+        """Download a single message's media under the concurrency semaphore.
+
+        Media with a resolvable filename streams through iter_download in
+        1 MiB chunks (Telegram's DC chunk size) straight into the open
+        file, avoiding download_media's per-chunk bytes accumulation.
+        Anything without a usable file attribute falls back to
+        download_media, which handles naming itself.
+        """
+        file = message.file
+        name = getattr(file, 'name', None) if file else None
+        ext = getattr(file, 'ext', None) if file else None
+        if not name and ext:
+            name = f"{message.id}{ext}"
+
+        async with self._dl_sem, self._api_limiter:
+            if name:
+                dest = dest_folder / name
+                with open(dest, "wb") as f:
+                    async for chunk in self.client.iter_download(
+                        message.media, chunk_size=1024 * 1024
+                    ):
+                        f.write(chunk)
+                return dest
+            path = await self.client.download_media(message, file=dest_folder)
+        return Path(path) if path else None
+
+    async def _collect_comment_media(self, message: Message, channel_entity) -> list[Message]:
+        """Drain the comment iterator, keeping comments with downloadable media.
+
+        Capped at MAX_COMMENTS_SCANNED so spam-heavy reply chains can't
+        make a single post take unbounded time.
+        """
+        from .settings import MAX_COMMENTS_SCANNED
+
+        comments = []
         try:
-            comment_count = 0
             comments_checked = 0
             logger.info(f"Checking comments for post {message.id}...")
-            
-            async for comment in self.client.iter_messages(channel_entity, reply_to=message.id):
+            async for comment in self.client.iter_messages(
+                channel_entity, reply_to=message.id, limit=MAX_COMMENTS_SCANNED
+            ):
                 comments_checked += 1
-                if comment.media:
-                    try:
-                        # Check file size for comments too
-                        should_download = True
-                        if hasattr(comment.media, 'document'):
-                            file_size = getattr(comment.media.document, 'size', 0)
-                            if file_size > MAX_FILE_SIZE_BYTES:
-                                logger.warning(f"Skipping comment media: file size {file_size / 1024 / 1024:.2f}MB exceeds limit")
-                                should_download = False
-                        
-                        if should_download:
-                            path = await self.client.download_media(comment, file=dest_folder)
-                            if path:
-                                paths.append(Path(path))
-                                comment_count += 1
-                                logger.info(f"Downloaded comment media: {path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to download media from comment {comment.id}: {e}")
-                        # Continue with other comments even if one fails
-                        continue
-            
-            logger.info(f"Checked {comments_checked} comments, downloaded {comment_count} images from comments")
+                if comment.media and self._media_within_size_limit(comment, "comment"):
+                    comments.append(comment)
+            logger.info(f"Checked {comments_checked} comments, {len(comments)} with downloadable media")
         except Exception as e:
             logger.warning(f"Error iterating comments: {e}")
             # Don't fail the entire post if comment iteration fails
-            
+        return comments
+
+    async def download_media_with_comments(self, message: Message, dest_folder: Path, channel_entity) -> list[Path]:
+        """Downloads all media from the message and its comments into the specified folder.
+
+        The main-post download starts immediately and runs while the
+        comment list is being discovered; comment downloads then run
+        concurrently too, all capped by the semaphore created in
+        connect().
+        """
+        paths = []
+
+        has_main = bool(
+            message.media and self._media_within_size_limit(message, "main post")
+        )
+
+        # Overlap the main-post byte transfer with the comment-discovery RPC
+        main_task = (
+            asyncio.create_task(self._download_one(message, dest_folder))
+            if has_main else None
+        )
+        comments = await self._collect_comment_media(message, channel_entity)
+
+        if main_task is not None:
+            try:
+                main_path = await main_task
+            except Exception as e:
+                logger.error(f"Download failed for main post: {e}")
+                raise
+            if main_path:
+                paths.append(main_path)
+                logger.info(f"Downloaded main post media: {main_path}")
+
+        if not comments:
+            return paths
+
+        results = await asyncio.gather(
+            *[self._download_one(comment, dest_folder) for comment in comments],
+            return_exceptions=True,
+        )
+
+        comment_count = 0
+        for comment, res in zip(comments, results):
+            if isinstance(res, BaseException):
+                logger.warning(f"Failed to download media from comment {comment.id}: {res}")
+                # Continue with other comments even if one fails
+                continue
+            if res is None:
+                continue
+            paths.append(res)
+            comment_count += 1
+            logger.info(f"Downloaded comment media: {res}")
+
+        logger.info(f"Downloaded {comment_count} images from comments")
         return paths
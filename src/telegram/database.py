@@ -1,27 +1,185 @@
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from .models import ImportedPost, ContentFormat
+from typing import Iterator
+from .models import ImportedPost, ContentFormat, PhotoScore
 
-def adapt_datetime(dt: datetime) -> str:
-    return dt.isoformat()
+def adapt_datetime(dt: datetime) -> int:
+    # Integer epoch: half the bytes of isoformat text and ~10x faster
+    # to decode than fromisoformat
+    return int(dt.timestamp())
 
 def convert_datetime(val: bytes) -> datetime:
-    return datetime.fromisoformat(val.decode())
+    s = val.decode()
+    if s.isdigit():
+        return datetime.fromtimestamp(int(s))
+    # CURRENT_TIMESTAMP defaults and legacy rows are still ISO text
+    return datetime.fromisoformat(s)
 
 # Register adapters and converters for Python 3.12+ compatibility
 sqlite3.register_adapter(datetime, adapt_datetime)
 sqlite3.register_converter("TIMESTAMP", convert_datetime)
 sqlite3.register_converter("timestamp", convert_datetime)
 
+# content_format is persisted as a one-byte integer code instead of its
+# text value: smaller rows and integer b-tree compares. The enum itself
+# stays string-based for the rest of the codebase.
+_FORMAT_CODES = {
+    ContentFormat.PHOTO: 0,
+    ContentFormat.VIDEO: 1,
+    ContentFormat.MIXED: 2,
+}
+_CODE_TO_FORMAT = {code: fmt for fmt, code in _FORMAT_CODES.items()}
+
+
+def _score_params(file_path: str, score, model_name) -> tuple | None:
+    """Flatten a dict or PhotoScore into insert parameters.
+
+    Returns None for explicit photos, which are never persisted.
+    """
+    if isinstance(score, PhotoScore):
+        if score.is_explicit:
+            return None
+        return (
+            file_path,
+            score.wow_factor,
+            score.engagement,
+            score.tiktok_fit,
+            score.reasoning,
+            model_name,
+            score.watermark_offset_pct,
+        )
+    if score.get('is_explicit', False):
+        return None
+    return (
+        file_path,
+        score['wow_factor'],
+        score['engagement'],
+        score['tiktok_fit'],
+        score['reasoning'],
+        model_name,
+        score.get('watermark_offset_pct'),
+    )
+
+
+def _decode_format(val) -> ContentFormat:
+    if isinstance(val, int):
+        return _CODE_TO_FORMAT[val]
+    # Rows written before the integer-code migration
+    return ContentFormat(val)
+
+
+# SQL hoisted to module constants so every call passes the same string
+# object: sqlite3's per-connection statement cache keys on the text, and
+# constant reuse guarantees hits in the tight post_exists loop.
+SQL_POST_EXISTS = "SELECT 1 FROM imported_posts WHERE channel_name = ? AND post_id = ?"
+SQL_KNOWN_POST_IDS = "SELECT post_id FROM imported_posts WHERE channel_name = ?"
+SQL_INSERT_POST = """
+    INSERT INTO imported_posts
+    (channel_name, post_id, date, model_name, set_name, content_format, file_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERT_POST_IF_NEW = """
+    INSERT INTO imported_posts
+    (channel_name, post_id, date, model_name, set_name, content_format, file_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(channel_name, post_id) DO NOTHING
+    RETURNING id
+"""
+SQL_POSTS_BY_CHANNEL = "SELECT * FROM imported_posts WHERE channel_name = ?"
+SQL_MODEL_BY_PATH = "SELECT model_name FROM imported_posts WHERE file_path = ?"
+SQL_MARK_PROCESSED = "UPDATE imported_posts SET curation_processed = 1 WHERE file_path = ?"
+SQL_CLAIM_POST = (
+    "UPDATE imported_posts SET curation_processed = 1 "
+    "WHERE file_path = ? AND curation_processed IS NOT 1 "
+    "RETURNING 1"
+)
+SQL_IS_PROCESSED = "SELECT curation_processed FROM imported_posts WHERE file_path = ?"
+SQL_INSERT_SCORE = """
+    INSERT INTO photo_scores
+    (file_path, wow_factor, engagement, tiktok_fit,
+     reasoning, model_name, watermark_offset_pct)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO NOTHING
+    RETURNING id
+"""
+SQL_SCORE_BY_PATH = "SELECT * FROM photo_scores WHERE file_path = ?"
+# executemany variant: RETURNING is not allowed there, so the bulk path
+# reports inserted rows via total_changes instead
+SQL_INSERT_SCORE_BULK = """
+    INSERT INTO photo_scores
+    (file_path, wow_factor, engagement, tiktok_fit,
+     reasoning, model_name, watermark_offset_pct)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO NOTHING
+"""
+
+SQL_CREATE_SCORE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_combined_score_path "
+    "ON photo_scores(combined_score DESC, file_path)"
+)
+
+# combined_score is computed by SQLite itself (stored generated column),
+# matching the round(avg, 1) the Python side used to do per insert
+SQL_CREATE_PHOTO_SCORES = """
+    CREATE TABLE IF NOT EXISTS photo_scores (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT NOT NULL UNIQUE,
+        wow_factor INTEGER NOT NULL,
+        engagement INTEGER NOT NULL,
+        tiktok_fit INTEGER NOT NULL,
+        combined_score REAL GENERATED ALWAYS AS
+            (ROUND((wow_factor + engagement + tiktok_fit) / 3.0, 1)) STORED,
+        reasoning TEXT NOT NULL,
+        model_name TEXT,
+        watermark_offset_pct REAL,
+        scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
 class TelegramImportDB:
-    def __init__(self, db_path: Path):
-        """Initialize SQLite, create table if not exists."""
+    def __init__(self, db_path: Path | str):
+        """Initialize SQLite, create table if not exists.
+
+        Accepts ":memory:" for an in-memory database (used by tests).
+        A single connection is opened once and reused by every method;
+        the import hot loop previously paid connect/teardown (plus
+        journal setup) per query. WAL + synchronous=NORMAL let readers
+        and the writer overlap while keeping durability on app crash.
+        """
         self.db_path = db_path
+        self.conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp structures off disk, give the page cache 64 MiB, and
+        # let reads come through mmap instead of read() syscalls
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        # Lazy file_path -> model_name cache for get_model_by_path;
+        # populated on first lookup, dropped whenever posts are written
+        self._path_to_model: dict[str, str] | None = None
         self._init_db()
-    
+
+    def close(self):
+        """Close the shared connection.
+
+        PRAGMA optimize re-runs ANALYZE for tables whose stats went
+        stale during this session, so the next open plans with fresh
+        numbers; it is a no-op when nothing changed.
+        """
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        with self.conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS imported_posts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -30,115 +188,229 @@ class TelegramImportDB:
                     date TIMESTAMP NOT NULL,
                     model_name TEXT NOT NULL,
                     set_name TEXT,
-                    content_format TEXT NOT NULL,
+                    content_format INTEGER NOT NULL,
                     file_path TEXT NOT NULL,
+                    curation_processed INTEGER DEFAULT 0,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     UNIQUE(channel_name, post_id)
                 );
             """)
+
+            # Databases created before the curation_processed column
+            # existed need it added in place
+            try:
+                conn.execute(
+                    "ALTER TABLE imported_posts ADD COLUMN curation_processed INTEGER DEFAULT 0"
+                )
+            except sqlite3.OperationalError:
+                pass  # Column already present
             
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS photo_scores (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_path TEXT NOT NULL UNIQUE,
-                    wow_factor INTEGER NOT NULL,
-                    engagement INTEGER NOT NULL,
-                    tiktok_fit INTEGER NOT NULL,
-                    combined_score REAL NOT NULL,
-                    reasoning TEXT NOT NULL,
-                    model_name TEXT,
-                    watermark_offset_pct REAL,
-                    scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
+            conn.execute(SQL_CREATE_PHOTO_SCORES)
+
+            # Databases from before the generated column store
+            # combined_score as a plain column (hidden flag 0); rebuild
+            # the table once so the same schema serves old and new rows
+            legacy = conn.execute(
+                "SELECT hidden FROM pragma_table_xinfo('photo_scores') "
+                "WHERE name = 'combined_score'"
+            ).fetchone()
+            if legacy and legacy[0] == 0:
+                conn.execute("ALTER TABLE photo_scores RENAME TO photo_scores_legacy")
+                conn.execute(SQL_CREATE_PHOTO_SCORES)
+                conn.execute("""
+                    INSERT INTO photo_scores
+                    (id, file_path, wow_factor, engagement, tiktok_fit,
+                     reasoning, model_name, watermark_offset_pct, scored_at)
+                    SELECT id, file_path, wow_factor, engagement, tiktok_fit,
+                           reasoning, model_name, watermark_offset_pct, scored_at
+                    FROM photo_scores_legacy
+                """)
+                conn.execute("DROP TABLE photo_scores_legacy")
+
+            # Explicit indexes for the hot lookups: duplicate probes on
+            # (channel_name, post_id), curation lookups by file_path, and
+            # get_all_scores ordering by combined_score.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_channel_post "
+                "ON imported_posts(channel_name, post_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_file_path "
+                "ON imported_posts(file_path)"
+            )
+            # file_path tie-breaks the ordering so ranked reads (and
+            # keyset pagination) walk the index deterministically
+            conn.execute("DROP INDEX IF EXISTS idx_combined_score")
+            conn.execute(SQL_CREATE_SCORE_INDEX)
+
+            # Seed planner statistics so the fresh indexes are actually
+            # chosen; without stats SQLite can prefer a table scan
+            conn.execute("ANALYZE")
+
+            # Schema v1: migrate ISO-text dates to integer epoch once
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if user_version < 1:
+                conn.execute(
+                    "UPDATE imported_posts "
+                    "SET date = CAST(strftime('%s', date) AS INTEGER) "
+                    "WHERE typeof(date) = 'text'"
+                )
+                conn.execute("PRAGMA user_version = 1")
+
+            # Schema v2: text content_format values become integer codes
+            if user_version < 2:
+                conn.execute(
+                    "UPDATE imported_posts SET content_format = CASE content_format "
+                    "WHEN 'photo' THEN 0 WHEN 'video' THEN 1 WHEN 'mixed' THEN 2 "
+                    "END WHERE typeof(content_format) = 'text'"
+                )
+                conn.execute("PRAGMA user_version = 2")
 
     def post_exists(self, channel_name: str, post_id: int) -> bool:
         """Check for duplicate by channel_name + post_id."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM imported_posts WHERE channel_name = ? AND post_id = ?",
-                (channel_name, post_id)
-            )
-            return cursor.fetchone() is not None
-    
+        cursor = self.conn.execute(SQL_POST_EXISTS, (channel_name, post_id))
+        return cursor.fetchone() is not None
+
+    def get_known_post_ids(self, channel_name: str) -> set[int]:
+        """Get all imported post_ids for a channel as a set.
+
+        Lets the import loop test duplicates with an O(1) membership
+        check instead of one SQLite query per scanned message.
+        """
+        cursor = self.conn.execute(SQL_KNOWN_POST_IDS, (channel_name,))
+        return {row[0] for row in cursor}
+
     def save_post(self, post: ImportedPost) -> int:
         """Save post record, returns auto-generated id."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        with self.conn as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO imported_posts 
-                (channel_name, post_id, date, model_name, set_name, content_format, file_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+                SQL_INSERT_POST,
                 (
                     post.channel_name,
                     post.post_id,
                     post.date,
                     post.model_name,
                     post.set_name,
-                    post.content_format.value,
+                    _FORMAT_CODES[post.content_format],
                     post.file_path
                 )
             )
             if post.id is None:
                 post.id = cursor.lastrowid
+            self._path_to_model = None
             return cursor.lastrowid
     
-    def get_posts_by_channel(self, channel_name: str) -> list[ImportedPost]:
-        """Get all channel posts (for debugging)."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            conn.row_factory = sqlite3.Row
+    def save_post_if_new(self, post: ImportedPost) -> int | None:
+        """Save post unless (channel_name, post_id) is already imported.
+
+        Collapses the post_exists probe + INSERT pair into one statement:
+        the conflict is resolved at the unique index itself. Returns the
+        new row id, or None if the post was already there.
+        """
+        with self.conn as conn:
             cursor = conn.execute(
-                "SELECT * FROM imported_posts WHERE channel_name = ?",
-                (channel_name,)
+                SQL_INSERT_POST_IF_NEW,
+                (
+                    post.channel_name,
+                    post.post_id,
+                    post.date,
+                    post.model_name,
+                    post.set_name,
+                    _FORMAT_CODES[post.content_format],
+                    post.file_path
+                )
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        post.id = row[0]
+        self._path_to_model = None
+        return row[0]
+
+    def save_posts_bulk(self, posts: list[ImportedPost]):
+        """Insert many post records in one transaction.
+
+        Amortizes the per-commit fsync over the whole batch instead of
+        paying it per row like save_post.
+        """
+        if not posts:
+            return
+        with self.conn as conn:
+            conn.executemany(
+                SQL_INSERT_POST,
+                [
+                    (
+                        post.channel_name,
+                        post.post_id,
+                        post.date,
+                        post.model_name,
+                        post.set_name,
+                        _FORMAT_CODES[post.content_format],
+                        post.file_path
+                    )
+                    for post in posts
+                ]
+            )
+        self._path_to_model = None
+
+    def iter_posts_by_channel(self, channel_name: str) -> Iterator[ImportedPost]:
+        """Stream channel posts straight off the cursor.
+
+        Keeps memory flat for large channels instead of materializing
+        every row up front.
+        """
+        cursor = self.conn.execute(SQL_POSTS_BY_CHANNEL, (channel_name,))
+        for row in cursor:
+            yield ImportedPost(
+                id=row['id'],
+                channel_name=row['channel_name'],
+                post_id=row['post_id'],
+                date=row['date'],
+                model_name=row['model_name'],
+                set_name=row['set_name'],
+                content_format=_decode_format(row['content_format']),
+                file_path=row['file_path']
             )
-            rows = cursor.fetchall()
-            return [
-                ImportedPost(
-                    id=row['id'],
-                    channel_name=row['channel_name'],
-                    post_id=row['post_id'],
-                    date=row['date'],
-                    model_name=row['model_name'],
-                    set_name=row['set_name'],
-                    content_format=ContentFormat(row['content_format']),
-                    file_path=row['file_path']
-                ) for row in rows
-            ]
+
+    def get_posts_by_channel(self, channel_name: str) -> list[ImportedPost]:
+        """Get all channel posts (for debugging)."""
+        return list(self.iter_posts_by_channel(channel_name))
     def get_model_by_path(self, file_path_suffix: str) -> str | None:
         """Find model name by matching file path suffix (e.g. Channel/Date)."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            # We match strict equality first for safety
-            cursor = conn.execute(
-                "SELECT model_name FROM imported_posts WHERE file_path = ?",
-                (file_path_suffix,)
+        # We match strict equality first for safety; the mapping is warmed
+        # from one SELECT so repeated curation probes stay in memory
+        if self._path_to_model is None:
+            cursor = self.conn.execute(
+                "SELECT file_path, model_name FROM imported_posts"
             )
-            row = cursor.fetchone()
-            if row:
-                return row[0]
-            return None
+            self._path_to_model = {row[0]: row[1] for row in cursor}
+        return self._path_to_model.get(file_path_suffix)
 
     def mark_post_processed(self, file_path_suffix: str):
         """Mark a post as processed by curation pipeline."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            conn.execute(
-                "UPDATE imported_posts SET curation_processed = 1 WHERE file_path = ?",
-                (file_path_suffix,)
-            )
+        with self.conn as conn:
+            conn.execute(SQL_MARK_PROCESSED, (file_path_suffix,))
+
+    def claim_post(self, file_path_suffix: str) -> bool:
+        """Atomically mark a post processed, returning whether we won the claim.
+
+        Collapses the is_post_processed + mark_post_processed
+        read-then-write pair into one statement: returns True iff the post
+        existed and was not already processed.
+        """
+        with self.conn as conn:
+            cursor = conn.execute(SQL_CLAIM_POST, (file_path_suffix,))
+            return cursor.fetchone() is not None
 
     def is_post_processed(self, file_path_suffix: str) -> bool:
         """Check if post was already marked as processed."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            cursor = conn.execute(
-                "SELECT curation_processed FROM imported_posts WHERE file_path = ?",
-                (file_path_suffix,)
-            )
-            row = cursor.fetchone()
-            if row:
-                return bool(row[0])
-            return False
+        cursor = self.conn.execute(SQL_IS_PROCESSED, (file_path_suffix,))
+        row = cursor.fetchone()
+        if row:
+            return bool(row[0])
+        return False
 
-    def save_photo_score(self, file_path: str, score: dict, model_name: str = None) -> int | None:
+    def save_photo_score(self, file_path: str, score: dict | PhotoScore, model_name: str = None) -> int | None:
         """
         Save photo score to database. Skips explicit photos.
         Returns the inserted row id or None if skipped/duplicate.
@@ -148,70 +420,114 @@ class TelegramImportDB:
             score: Dict with keys: wow_factor, engagement, tiktok_fit, is_explicit, reasoning
             model_name: Optional model name from imported_posts
         """
-        # Skip explicit photos
-        if score.get('is_explicit', False):
+        # Skip explicit photos before any DB work
+        params = _score_params(file_path, score, model_name)
+        if params is None:
             return None
-        
-        combined = round((score['wow_factor'] + score['engagement'] + score['tiktok_fit']) / 3.0, 1)
-        
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            try:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO photo_scores 
-                    (file_path, wow_factor, engagement, tiktok_fit, combined_score, 
-                     reasoning, model_name, watermark_offset_pct)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        file_path,
-                        score['wow_factor'],
-                        score['engagement'],
-                        score['tiktok_fit'],
-                        combined,
-                        score['reasoning'],
-                        model_name,
-                        score.get('watermark_offset_pct')
-                    )
-                )
-                return cursor.lastrowid
-            except sqlite3.IntegrityError:
-                # Duplicate file_path, skip silently
-                return None
-    
+
+        # ON CONFLICT DO NOTHING makes the common "already scored" path a
+        # plain no-op row instead of raising/catching IntegrityError;
+        # combined_score is filled in by the generated column
+        with self.conn as conn:
+            cursor = conn.execute(SQL_INSERT_SCORE, params)
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def save_photo_scores(self, entries: list[tuple[str, dict | PhotoScore, str | None]]) -> int:
+        """Save many photo scores in one transaction.
+
+        Same semantics as save_photo_score per entry (explicit photos and
+        already-scored paths are skipped) but amortizes the commit fsync
+        over the whole batch. Returns the number of rows inserted.
+
+        Args:
+            entries: (file_path, score_dict, model_name) tuples
+        """
+        rows = [
+            params
+            for file_path, score, model_name in entries
+            if (params := _score_params(file_path, score, model_name)) is not None
+        ]
+        if not rows:
+            return 0
+        with self.conn as conn:
+            before = conn.total_changes
+            conn.executemany(SQL_INSERT_SCORE_BULK, rows)
+            return conn.total_changes - before
+
+    @contextmanager
+    def bulk_load_photo_scores(self):
+        """Bulk-ingest scores with the ranking index deferred.
+
+        Drops idx_combined_score_path for the duration, yields a list to
+        extend with (file_path, score_dict, model_name) entries, then
+        inserts them in one transaction and rebuilds the index bottom-up
+        (one pass instead of a b-tree insert per row), refreshing stats.
+        """
+        self.conn.execute("DROP INDEX IF EXISTS idx_combined_score_path")
+        entries: list[tuple[str, dict, str | None]] = []
+        try:
+            yield entries
+            self.save_photo_scores(entries)
+        finally:
+            with self.conn as conn:
+                conn.execute(SQL_CREATE_SCORE_INDEX)
+                conn.execute("ANALYZE")
+
     def get_photo_score(self, file_path: str) -> dict | None:
         """Get photo score by file path."""
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM photo_scores WHERE file_path = ?",
-                (file_path,)
+        cursor = self.conn.execute(SQL_SCORE_BY_PATH, (file_path,))
+        row = cursor.fetchone()
+        if row:
+            return dict(row)
+        return None
+
+    def iter_all_scores(
+        self,
+        min_score: float = None,
+        after: tuple[float, str] = None,
+        limit: int = None,
+    ) -> Iterator[dict]:
+        """Stream photo scores ordered by (combined_score DESC, file_path).
+
+        Args:
+            min_score: Optional minimum combined_score filter
+            after: Optional (combined_score, file_path) keyset cursor;
+                resumes strictly after that row. Unlike OFFSET, the index
+                seeks straight to the page with no re-sort or skipped-row
+                scan.
+            limit: Optional page size
+        """
+        query = "SELECT * FROM photo_scores"
+        where = []
+        params = []
+
+        if after is not None:
+            where.append(
+                "(combined_score < ? OR (combined_score = ? AND file_path > ?))"
             )
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
-    
+            params += [after[0], after[0], after[1]]
+        if min_score is not None:
+            where.append("combined_score >= ?")
+            params.append(min_score)
+        if where:
+            query += " WHERE " + " AND ".join(where)
+
+        query += " ORDER BY combined_score DESC, file_path"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.conn.execute(query, params)
+        for row in cursor:
+            yield dict(row)
+
     def get_all_scores(self, min_score: float = None) -> list[dict]:
         """
         Get all photo scores with optional filters.
-        
+
         Args:
             min_score: Optional minimum combined_score filter
         """
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            query = "SELECT * FROM photo_scores"
-            params = []
-            
-            if min_score is not None:
-                query += " WHERE combined_score >= ?"
-                params.append(min_score)
-            
-            query += " ORDER BY combined_score DESC"
-            
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        return list(self.iter_all_scores(min_score))
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -7,24 +7,41 @@ class ContentFormat(str, Enum):
     VIDEO = "video"
     MIXED = "mixed"
 
-class NormalizedMetadata(BaseModel):
+@dataclass(slots=True)
+class NormalizedMetadata:
     """Adapter output — normalized metadata."""
     model_name: str
-    set_name: str | None = None
     content_format: ContentFormat
+    set_name: str | None = None
 
-class ImportedPost(BaseModel):
+@dataclass(slots=True)
+class ImportedPost:
     """Database record for an imported post."""
-    id: int | None = None  # SQLite autoincrement
     channel_name: str
     post_id: int  # Original message ID in the channel
     date: datetime
     model_name: str
-    set_name: str | None = None
     content_format: ContentFormat
     file_path: str  # Relative path to the folder with content
+    set_name: str | None = None
+    id: int | None = None  # SQLite autoincrement
+
+@dataclass(slots=True)
+class PhotoScore:
+    """Structured score payload for the photo_scores save paths.
+
+    Fixed-offset attribute access instead of dict hash lookups per
+    field; the database layer also still accepts plain dicts.
+    """
+    wow_factor: int
+    engagement: int
+    tiktok_fit: int
+    is_explicit: bool
+    reasoning: str
+    watermark_offset_pct: float | None = None
 
-class ImportResult(BaseModel):
+@dataclass(slots=True)
+class ImportResult:
     """Result of the import process."""
     total_processed: int
     downloaded: int
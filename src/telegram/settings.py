@@ -14,3 +14,12 @@ DATABASE_PATH = Path("data/telegram_imports.db")
 
 # Error handling
 MAX_CONSECUTIVE_ERRORS = 3
+
+# Incremental imports: stop scanning after this many consecutive
+# already-imported posts (Telegram iterates newest -> oldest, so a long
+# run of duplicates means we've caught up with history)
+STOP_AFTER_DUPLICATES = 50
+
+# Bound per-post comment scanning; spam-heavy reply chains can run to
+# hundreds of messages with no media
+MAX_COMMENTS_SCANNED = 200
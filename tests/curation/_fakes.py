@@ -0,0 +1,35 @@
+"""In-memory fakes for curation tests.
+
+AsyncMock answers instantly, which hides concurrency behavior entirely;
+FakeChatGroq returns deterministic canned JSON after a configurable
+simulated latency, so tests can observe real request overlap and timing
+without a network.
+"""
+import asyncio
+from types import SimpleNamespace
+
+
+class FakeChatGroq:
+    """Drop-in replacement for the scorer's llm attribute.
+
+    Tracks call count and the maximum number of concurrently in-flight
+    requests so tests can assert on parallelism, not just results.
+    """
+
+    def __init__(self, canned_json: str, latency: float = 0.0):
+        self.canned_json = canned_json
+        self.latency = latency
+        self.calls = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return SimpleNamespace(content=self.canned_json)
+        finally:
+            self._in_flight -= 1
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -137,3 +138,79 @@ async def test_batching(sample_folder, mock_scorer, tmp_path):
     
     # Should be called 2 times: 5 images, then 2 images
     assert mock_scorer.score_batch.call_count == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_batches(sample_folder, mock_scorer, tmp_path):
+    # 7 images -> 2 batches; both must be in flight at the same time
+    for i in range(5):
+        (sample_folder / f"extra{i}.jpg").touch()
+
+    in_flight = 0
+    max_in_flight = 0
+    both_started = asyncio.Event()
+
+    async def side_effect(paths):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        if in_flight >= 2:
+            both_started.set()
+        # Deadlocks (and times out) if batches run sequentially
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        in_flight -= 1
+        return [ImageScore(wow_factor=5, engagement=5, tiktok_fit=5, is_explicit=False, reasoning="")] * len(paths)
+
+    mock_scorer.score_batch.side_effect = side_effect
+
+    config = CurationConfig(batch_size=5, max_concurrent_batches=2)
+    pipeline = CurationPipeline(config=config, scorer=mock_scorer)
+    pipeline.curated_base_dir = tmp_path / "curated"
+
+    report = await pipeline.curate_folder(sample_folder)
+
+    assert max_in_flight == 2
+    assert report.errors == 0
+
+@pytest.mark.asyncio
+async def test_batch_concurrency_speedup(sample_folder, tmp_path):
+    """End-to-end: the semaphore-gated pipeline beats sequential scoring.
+
+    Uses FakeChatGroq (real latency, canned output) instead of AsyncMock
+    so the timing difference is actually observable.
+    """
+    import json
+    import time
+    from src.curation.scorer import ImageScorer
+    from tests.curation._fakes import FakeChatGroq
+
+    # 8 images -> 8 single-image batches of 50ms simulated latency each
+    for i in range(6):
+        (sample_folder / f"extra{i}.jpg").touch()
+
+    canned = json.dumps({"scores": [{
+        "wow_factor": 5, "engagement": 5, "tiktok_fit": 5,
+        "is_explicit": False, "reasoning": "ok"
+    }]})
+
+    async def run(max_concurrent: int) -> float:
+        with patch("src.curation.scorer.ChatGroq"):
+            scorer = ImageScorer(api_key="fake_key")
+        fake = FakeChatGroq(canned, latency=0.05)
+        scorer.llm = fake
+
+        config = CurationConfig(batch_size=1, max_concurrent_batches=max_concurrent, dry_run=True)
+        pipeline = CurationPipeline(config=config, scorer=scorer)
+        pipeline.curated_base_dir = tmp_path / "curated"
+
+        with patch("src.curation.scorer.ThumbnailGenerator.to_base64", return_value="base64str"):
+            start = time.perf_counter()
+            report = await pipeline.curate_folder(sample_folder)
+        assert report.errors == 0
+        assert fake.calls == 8
+        assert fake.max_in_flight <= max_concurrent
+        return time.perf_counter() - start
+
+    sequential_time = await run(1)
+    gather_time = await run(4)
+
+    assert gather_time < 0.6 * sequential_time
@@ -143,3 +143,70 @@ async def test_score_batch_mismatch(scorer, mock_batch_response, mock_llm_respon
         assert len(results) == 3
         # All should have the same score from mock_llm_response
         assert all(r.wow_factor == 8 for r in results)
+
+@pytest.mark.asyncio
+async def test_cache_hit(mock_llm_response, tmp_path):
+    """Second scoring of the same thumbnail is served from the on-disk cache."""
+    import json
+    
+    with patch("src.curation.scorer.ChatGroq") as MockGroq:
+        scorer = ImageScorer(api_key="fake_key", cache_path=tmp_path / "cache.db")
+        scorer.llm = MockGroq.return_value
+    
+    mock_msg = MagicMock()
+    mock_msg.content = json.dumps(mock_llm_response)
+    scorer.llm.ainvoke = AsyncMock(return_value=mock_msg)
+    
+    dummy_path = tmp_path / "test.jpg"
+    dummy_path.touch()
+    
+    with patch("src.curation.scorer.ThumbnailGenerator.to_base64", return_value="base64str"):
+        first = await scorer.score(dummy_path)
+        second = await scorer.score(dummy_path)
+        
+        assert scorer.llm.ainvoke.call_count == 1
+        assert second == first
+
+@pytest.mark.asyncio
+async def test_rate_limit_waits():
+    """acquire() sleeps when the request bucket is empty, then proceeds."""
+    from src.curation.scorer import TokenBucket
+    
+    bucket = TokenBucket(rpm_limit=60, tpm_limit=100_000)
+    # First acquire fits immediately
+    await bucket.acquire(100)
+    
+    # Drain the request bucket; the next acquire must wait for a refill
+    bucket._requests = 0.0
+    sleeps = []
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        bucket._requests = 1.0  # simulate the refill that waiting buys
+    
+    with patch("asyncio.sleep", fake_sleep):
+        await bucket.acquire(100)
+    
+    assert len(sleeps) == 1
+    assert sleeps[0] > 0
+
+@pytest.mark.asyncio
+async def test_retry_succeeds_after_transient(scorer, mock_llm_response, tmp_path):
+    """Transient errors are retried with backoff instead of failing the score."""
+    import json
+    
+    mock_msg = MagicMock()
+    mock_msg.content = json.dumps(mock_llm_response)
+    scorer.llm.ainvoke = AsyncMock(side_effect=[TimeoutError(), TimeoutError(), mock_msg])
+    
+    dummy_path = tmp_path / "test.jpg"
+    dummy_path.touch()
+    
+    async def no_sleep(delay):
+        pass
+    
+    with patch("src.curation.scorer.ThumbnailGenerator.to_base64", return_value="base64str"), \
+         patch("asyncio.sleep", no_sleep):
+        result = await scorer.score(dummy_path)
+        
+        assert scorer.llm.ainvoke.call_count == 3
+        assert result.wow_factor == 8
@@ -63,3 +63,24 @@ def test_token_estimation(sample_image):
     tokens = generator.estimate_tokens(sample_image)
     # 512*512 / 750 approx 349
     assert 300 < tokens < 400
+
+def test_passthrough_small_image(tmp_path):
+    """JPEGs already within max_size are passed through without decoding."""
+    img_path = tmp_path / "small.jpg"
+    Image.new('RGB', (100, 100), color='blue').save(img_path)
+
+    generator = ThumbnailGenerator(max_size=(512, 512))
+    from unittest.mock import patch
+    with patch("src.curation.thumbnail.Image.open") as mock_open:
+        thumbnail_bytes = generator.generate(img_path)
+        mock_open.assert_not_called()
+
+    assert thumbnail_bytes == img_path.read_bytes()
+
+def test_no_passthrough_large_image(sample_image):
+    """Oversized JPEGs still go through the resize pipeline."""
+    generator = ThumbnailGenerator(max_size=(512, 512))
+    thumbnail_bytes = generator.generate(sample_image)
+    assert thumbnail_bytes != sample_image.read_bytes()
+    with Image.open(io.BytesIO(thumbnail_bytes)) as img:
+        assert img.width <= 512
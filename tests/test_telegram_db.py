@@ -5,9 +5,12 @@ from src.telegram.database import TelegramImportDB
 from src.telegram.models import ImportedPost, ContentFormat
 
 @pytest.fixture
-def db(tmp_path):
-    db_path = tmp_path / "test_telegram.db"
-    return TelegramImportDB(db_path)
+def db():
+    # In-memory DB: identical schema and semantics, no per-test file
+    # creation or WAL fsync
+    db = TelegramImportDB(":memory:")
+    yield db
+    db.close()
 
 def test_save_and_retrieve_post(db):
     post = ImportedPost(
@@ -69,12 +72,9 @@ def test_unique_constraint(db):
 
 def test_photo_scores_table_creation(db):
     """Test that photo_scores table is created with correct schema."""
-    import sqlite3
-    conn = sqlite3.connect(db.db_path)
-    cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='photo_scores'")
+    cursor = db.conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='photo_scores'")
     result = cursor.fetchone()
-    conn.close()
-    
+
     assert result is not None, "photo_scores table should be created"
 
 
@@ -220,3 +220,179 @@ def test_save_photo_score_without_watermark(db):
     
     # In SQLite, None is NULL
     assert retrieved['watermark_offset_pct'] is None
+
+def test_save_posts_bulk(db):
+    """Bulk insert lands every row in one transaction."""
+    posts = [
+        ImportedPost(
+            channel_name="bulk_channel",
+            post_id=i,
+            date=datetime.now(),
+            model_name="Bulk Model",
+            content_format=ContentFormat.PHOTO,
+            file_path=f"bulk_channel/{i}"
+        )
+        for i in range(10_000)
+    ]
+    db.save_posts_bulk(posts)
+
+    assert len(db.get_posts_by_channel("bulk_channel")) == 10_000
+    assert db.post_exists("bulk_channel", 0)
+    assert db.post_exists("bulk_channel", 9_999)
+
+def test_save_photo_scores_bulk(db):
+    """Bulk score insert skips explicit entries and duplicates."""
+    base = {'wow_factor': 8, 'engagement': 8, 'tiktok_fit': 8, 'is_explicit': False, 'reasoning': 'ok'}
+    db.save_photo_score('test/already.jpg', base)
+
+    entries = [
+        ('test/bulk1.jpg', dict(base), 'Model A'),
+        ('test/bulk2.jpg', dict(base, is_explicit=True), None),   # skipped
+        ('test/already.jpg', dict(base, reasoning='dupe'), None), # skipped
+        ('test/bulk3.jpg', dict(base, watermark_offset_pct=50.0), None),
+    ]
+    inserted = db.save_photo_scores(entries)
+
+    assert inserted == 2
+    assert db.get_photo_score('test/bulk1.jpg')['model_name'] == 'Model A'
+    assert db.get_photo_score('test/bulk2.jpg') is None
+    assert db.get_photo_score('test/already.jpg')['reasoning'] == 'ok'
+    assert db.get_photo_score('test/bulk3.jpg')['watermark_offset_pct'] == 50.0
+
+def test_save_post_if_new(db):
+    """Duplicate imports are skipped in one statement, not raised."""
+    post = ImportedPost(
+        channel_name="test_channel",
+        post_id=321,
+        date=datetime.now(),
+        model_name="Test Model",
+        content_format=ContentFormat.PHOTO,
+        file_path="test_channel/321"
+    )
+
+    first = db.save_post_if_new(post)
+    assert first is not None
+    assert post.id == first
+
+    second = db.save_post_if_new(post)
+    assert second is None
+    assert len(db.get_posts_by_channel("test_channel")) == 1
+
+def test_query_plans_use_indexes(db):
+    """Hot queries must hit an index, not scan + temp B-tree sort."""
+    plan = " ".join(
+        row[3] for row in db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT 1 FROM imported_posts WHERE channel_name = ? AND post_id = ?",
+            ("c", 1),
+        )
+    )
+    assert "USING" in plan and "INDEX" in plan
+
+    plan = " ".join(
+        row[3] for row in db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM photo_scores ORDER BY combined_score DESC"
+        )
+    )
+    assert "idx_combined_score_path" in plan
+    assert "TEMP B-TREE" not in plan
+
+    plan = " ".join(
+        row[3] for row in db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM imported_posts WHERE channel_name = ?",
+            ("c",),
+        )
+    )
+    assert "USING" in plan and "INDEX" in plan
+
+def test_combined_score_migration(tmp_path):
+    """Legacy DBs with a plain combined_score column are rebuilt in place."""
+    import sqlite3
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE photo_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            file_path TEXT NOT NULL UNIQUE,
+            wow_factor INTEGER NOT NULL,
+            engagement INTEGER NOT NULL,
+            tiktok_fit INTEGER NOT NULL,
+            combined_score REAL NOT NULL,
+            reasoning TEXT NOT NULL,
+            model_name TEXT,
+            watermark_offset_pct REAL,
+            scored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute(
+        "INSERT INTO photo_scores (file_path, wow_factor, engagement, tiktok_fit, combined_score, reasoning) "
+        "VALUES ('legacy.jpg', 9, 8, 9, 8.7, 'old')"
+    )
+    conn.commit()
+    conn.close()
+
+    db = TelegramImportDB(db_path)
+
+    # Legacy row survives with the same (recomputed) value
+    legacy = db.get_photo_score('legacy.jpg')
+    assert abs(legacy['combined_score'] - 8.7) < 0.01
+
+    # New rows get combined_score from the generated column
+    db.save_photo_score('new.jpg', {
+        'wow_factor': 9, 'engagement': 8, 'tiktok_fit': 9,
+        'is_explicit': False, 'reasoning': 'new'
+    })
+    assert abs(db.get_photo_score('new.jpg')['combined_score'] - 8.7) < 0.01
+
+def test_iter_scores_keyset_pagination(db):
+    """Pages resume from an (score, path) cursor without overlap or gaps."""
+    base = {'engagement': 8, 'tiktok_fit': 8, 'is_explicit': False, 'reasoning': 'ok'}
+    for i, wow in enumerate([9, 5, 9, 7, 3]):
+        db.save_photo_score(f'test/page{i}.jpg', dict(base, wow_factor=wow))
+
+    page1 = list(db.iter_all_scores(limit=2))
+    assert len(page1) == 2
+
+    cursor = (page1[-1]['combined_score'], page1[-1]['file_path'])
+    page2 = list(db.iter_all_scores(after=cursor, limit=2))
+    page3 = list(db.iter_all_scores(after=(page2[-1]['combined_score'], page2[-1]['file_path'])))
+
+    paths = [r['file_path'] for r in page1 + page2 + page3]
+    assert paths == [r['file_path'] for r in db.get_all_scores()]
+    assert len(set(paths)) == 5
+
+def test_bulk_load_photo_scores(db):
+    """One-shot ingest defers the ranking index and restores it after."""
+    base = {'engagement': 7, 'tiktok_fit': 7, 'is_explicit': False, 'reasoning': 'bulk'}
+
+    with db.bulk_load_photo_scores() as entries:
+        entries.extend(
+            (f'test/load{i}.jpg', dict(base, wow_factor=i % 10), None)
+            for i in range(1000)
+        )
+        # Index is dropped while the load is in flight
+        names = [r['name'] for r in db.conn.execute("PRAGMA index_list('photo_scores')")]
+        assert 'idx_combined_score_path' not in names
+
+    assert len(db.get_all_scores()) == 1000
+    names = [r['name'] for r in db.conn.execute("PRAGMA index_list('photo_scores')")]
+    assert 'idx_combined_score_path' in names
+
+def test_save_photo_score_dataclass(db):
+    """PhotoScore instances work everywhere score dicts do."""
+    from src.telegram.models import PhotoScore
+
+    score = PhotoScore(wow_factor=8, engagement=9, tiktok_fit=7,
+                       is_explicit=False, reasoning='struct')
+    row_id = db.save_photo_score('test/struct.jpg', score, 'Test Model')
+    assert row_id is not None
+    assert abs(db.get_photo_score('test/struct.jpg')['combined_score'] - 8.0) < 0.01
+
+    explicit = PhotoScore(wow_factor=10, engagement=10, tiktok_fit=10,
+                          is_explicit=True, reasoning='nope')
+    assert db.save_photo_score('test/struct_explicit.jpg', explicit) is None
+
+    inserted = db.save_photo_scores([
+        ('test/struct2.jpg', PhotoScore(5, 5, 5, False, 'bulk'), None),
+        ('test/struct3.jpg', explicit, None),
+    ])
+    assert inserted == 1